@@ -1,23 +1,49 @@
 #! python3
+import concurrent.futures
+import copy
 import datetime
+import functools
+import hashlib
+import io
+import json
+import itertools
+import math
+import multiprocessing
+import operator
 import os
+import random
+import re
+import ssl
 import sys
 import time
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from typing import TypeVar
+from xml.sax.saxutils import escape
 
 # Work with DataFrames
 import pandas as pd
+import xlsxwriter
+from xlsxwriter.utility import xl_rowcol_to_cell
 
 # Work with Google Sheets
+import httplib2
 import pygsheets
+from google.auth.exceptions import TransportError
+from googleapiclient.errors import HttpError
 
 # Work with MS Word files
 from docx import Document
 from docx.enum.section import WD_ORIENT
+from docx.oxml.ns import qn
 from docx.shared import Inches, Pt
+from lxml import etree
 
 # Work with MS PowerPoint files
 from pptx import Presentation
 from pptx.dml.color import RGBColor
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.text import CT_RegularTextRun
 
 # import PyQt5
 from PyQt5 import QtCore, QtGui, QtWidgets
@@ -37,6 +63,1527 @@ if hasattr(QtCore.Qt, "AA+_UseHighDpiPixmaps"):
     QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
 
 
+# Normalized schedule shared by every output stage
+class Schedule(object):
+    # Fixed schema. Times are minutes since midnight and the repeated text
+    # columns are categoricals, so comparisons run on integer codes.
+    schema = {
+        "Date": "datetime64[ns]",
+        "Start Time": "int16",
+        "End Time": "int16",
+        "Section Number": "category",
+        "Section Title": "category",
+        "Instructor": "category",
+        "Building": "category",
+        "Room": "category",
+        "Block": "category",
+        "Floor": "category",
+    }
+    instructorTBA = "Instructor To Be Announced"
+    # Time of day blocks per center, as [start, end) in minutes since midnight
+    blocks = {
+        "GBC": [
+            ("Morning", 0, 12 * 60),
+            ("Afternoon", 12 * 60, 17 * 60),
+            ("Evening", 17 * 60, 24 * 60),
+        ],
+        "SFC": [
+            ("Daytime", 0, 17 * 60),
+            ("Evening", 17 * 60, 24 * 60),
+        ],
+    }
+    # Floors per center, as inclusive ranges of room names
+    floorRanges = {
+        "SFC": [
+            ("5th Floor", None, "Classroom 515"),
+            ("6th Floor", "Classroom 602", "Classroom 613"),
+            ("7th Floor", "Classroom 702", None),
+        ],
+    }
+
+    @classmethod
+    def fromReport(cls, report: pd.DataFrame, center: str) -> pd.DataFrame:
+        # Rows without a date or meeting time cannot be placed on any output
+        report = report.dropna(subset=["Date", "Start Time", "End Time"])
+        schedule = pd.DataFrame(index=report.index)
+        schedule["Date"] = report["Date"].dt.normalize()
+        for column in ["Start Time", "End Time"]:
+            times = report[column]
+            schedule[column] = (times.dt.hour * 60 + times.dt.minute).astype("int16")
+        for column in ["Section Number", "Section Title", "Instructor", "Building"]:
+            schedule[column] = report[column].fillna("").astype(str).astype("category")
+        schedule["Room"] = report["Room"].fillna("").astype(str).astype("category")
+
+        # Classify every row into its time block and floor once, up front
+        blocks = cls.blocks.get(center, [])
+        if blocks:
+            schedule["Block"] = pd.cut(
+                schedule["Start Time"],
+                bins=[start for _, start, _ in blocks] + [blocks[-1][2]],
+                labels=[name for name, _, _ in blocks],
+                right=False,
+            )
+        else:  # Empty report, there is no center to take blocks from
+            schedule["Block"] = pd.Categorical([None] * len(schedule))
+        floors = cls.floorRanges.get(center, [])
+        schedule["Floor"] = pd.Categorical(
+            schedule["Room"].map(lambda room: cls.roomFloor(room, floors)),
+            categories=[name for name, _, _ in floors],
+        )
+        return schedule.astype(cls.schema)[list(cls.schema)].reset_index(drop=True)
+
+    @staticmethod
+    def days(
+        schedule: pd.DataFrame, by: list[str]
+    ) -> Iterator[tuple[pd.Timestamp, pd.DataFrame]]:
+        # Sort once, then hand out each day as a contiguous slice of the sorted
+        # frame instead of re-scanning the whole frame with a mask per day.
+        sortedSchedule = schedule.sort_values(by=["Date", *by])
+        dates = sortedSchedule["Date"]
+        dayList = dates.drop_duplicates()
+        starts = list(dates.searchsorted(dayList))
+        for date, start, stop in zip(dayList, starts, starts[1:] + [len(dates)]):
+            yield date, sortedSchedule.iloc[start:stop]
+
+    @classmethod
+    def partition(
+        cls, sections: list["Section"], field: str, center: str
+    ) -> dict[str, list["Section"]]:
+        # Split on the block or floor field in one pass. Every block or floor of
+        # the center gets an entry, empty if no section falls in it, and
+        # sections keep their order.
+        ranges = cls.blocks if field == "block" else cls.floorRanges
+        groups = {name: [] for name, _, _ in ranges.get(center, [])}
+        for section in sections:
+            group = groups.get(getattr(section, field))
+            if group is not None:
+                group.append(section)
+        return groups
+
+    @staticmethod
+    def roomFloor(room: str, floorRanges: list) -> str | None:
+        for floor, first, last in floorRanges:
+            if (first is None or room >= first) and (last is None or room <= last):
+                return floor
+        return None
+
+
+# One meeting of a section, as the output builders see it. Slots keep records
+# small, and they pickle as a plain tuple of fields for the worker processes.
+class Section(object):
+    __slots__ = (
+        "date",
+        "start",
+        "end",
+        "number",
+        "title",
+        "instructor",
+        "building",
+        "room",
+        "block",
+        "floor",
+    )
+    # Schedule column of each field
+    columns = {
+        "date": "Date",
+        "start": "Start Time",
+        "end": "End Time",
+        "number": "Section Number",
+        "title": "Section Title",
+        "instructor": "Instructor",
+        "building": "Building",
+        "room": "Room",
+        "block": "Block",
+        "floor": "Floor",
+    }
+
+    def __init__(
+        self,
+        date: datetime.date,
+        start: int,
+        end: int,
+        number: str,
+        title: str,
+        instructor: str,
+        building: str,
+        room: str,
+        block: str | None,
+        floor: str | None,
+    ) -> None:
+        self.date = date
+        self.start = start
+        self.end = end
+        self.number = number
+        self.title = title
+        self.instructor = instructor
+        self.building = building
+        self.room = room
+        self.block = block
+        self.floor = floor
+
+    def __reduce__(self) -> tuple:
+        return (Section, tuple(getattr(self, field) for field in self.__slots__))
+
+    @classmethod
+    def fromSchedule(cls, schedule: pd.DataFrame) -> list["Section"]:
+        # Whole columns are converted at once, then zipped into records in row
+        # order. Rows without a block or floor get None.
+        values = {
+            field: schedule[column].astype(object).where(schedule[column].notna(), None)
+            for field, column in cls.columns.items()
+        }
+        values["date"] = schedule["Date"].dt.date
+        return [
+            cls(*fields) for fields in zip(*(values[field] for field in cls.__slots__))
+        ]
+
+    @classmethod
+    def days(
+        cls, schedule: pd.DataFrame, by: list[str]
+    ) -> list[tuple[pd.Timestamp, list["Section"]]]:
+        # Schedule.days with each day as section records
+        return [
+            (date, cls.fromSchedule(day)) for date, day in Schedule.days(schedule, by)
+        ]
+
+
+# Sections of one room on one day, in start time order
+class RoomDay(object):
+    __slots__ = ("date", "room", "sections")
+
+    def __init__(self, date: datetime.date, room: str, sections: list[Section]) -> None:
+        self.date = date
+        self.room = room
+        self.sections = sections
+
+    def __reduce__(self) -> tuple:
+        return (RoomDay, (self.date, self.room, self.sections))
+
+    @classmethod
+    def group(cls, sections: list[Section]) -> list["RoomDay"]:
+        # Sections must be sorted by date, room and start time
+        return [
+            cls(date, room, list(roomSections))
+            for (date, room), roomSections in itertools.groupby(
+                sections, key=operator.attrgetter("date", "room")
+            )
+        ]
+
+
+# Display text for schedule values. Each label is built once per distinct value,
+# since a report only has a few dozen times.
+class Labels(object):
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def time(minutes: int, padded: bool = False) -> str:
+        # "9:00 AM", or "09:00 AM" as strftime("%I:%M %p") gives when padded
+        hour, minute = divmod(int(minutes), 60)
+        label = f"{(hour % 12) or 12:02d}:{minute:02d} {'AM' if hour < 12 else 'PM'}"
+        return label if padded else label.lstrip("0")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def timeRange(start: int, end: int, separator: str = " to ") -> str:
+        return f"{Labels.time(start)}{separator}{Labels.time(end)}"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def weekday(date: datetime.date) -> str:
+        return date.strftime("%A")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def longDate(date: datetime.date) -> str:
+        # "January 5, 2026"
+        return f"{date.strftime('%B')} {date.day}, {date.year}"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def fullDate(date: datetime.date) -> str:
+        # "Monday, January 5, 2026"
+        return f"{Labels.weekday(date)}, {Labels.longDate(date)}"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def isoDate(date: datetime.date) -> str:
+        return date.strftime("%Y-%m-%d")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def instructor(name: str) -> str:
+        return "TBA" if name == Schedule.instructorTBA else name
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def roomNumber(room: str) -> str:
+        # "Classroom 501" as " 501"
+        return room.replace("Classroom", "")
+
+    @classmethod
+    def rows(
+        cls, sections: list[Section], fields: list[str], padded: bool = False
+    ) -> list[list[str]]:
+        # Display text of every cell, row by row. Besides Section fields there
+        # are "instructorLabel", with TBA for an unannounced instructor, and
+        # "roomNumber", the room without its "Classroom" prefix.
+        cells = {
+            "start": lambda section: cls.time(section.start, padded),
+            "end": lambda section: cls.time(section.end, padded),
+            "instructorLabel": lambda section: cls.instructor(section.instructor),
+            "roomNumber": lambda section: cls.roomNumber(section.room),
+        }
+        getters = [cells.get(field, operator.attrgetter(field)) for field in fields]
+        return [[str(getter(section)) for getter in getters] for section in sections]
+
+
+# Text measurement for autosizing. Advance widths of printable ASCII, space to
+# "~", are in thousandths of an em for the regular weight, so fitting needs no
+# font files. Other characters count as the font's average width.
+class TextFit(object):
+    widths = {
+        "Arial": (
+            "278 278 355 556 556 889 667 191 333 333 389 584 278 333 278 278 "
+            "556 556 556 556 556 556 556 556 556 556 278 278 584 584 584 556 1015 "
+            "667 667 722 722 667 611 778 722 278 500 667 556 833 722 778 667 778 "
+            "722 667 611 722 667 944 667 667 611 278 278 278 469 556 333 "
+            "556 556 500 556 556 278 556 556 222 222 500 222 833 556 556 556 556 "
+            "333 500 278 556 500 722 500 500 500 334 260 334 584"
+        ),
+        "Calibri": (
+            "226 326 401 498 507 715 682 221 303 303 498 498 250 306 252 386 "
+            "507 507 507 507 507 507 507 507 507 507 268 268 498 498 498 463 894 "
+            "579 544 533 615 488 459 631 623 252 319 520 420 855 646 662 517 673 "
+            "543 459 487 642 567 890 519 487 468 307 386 307 498 498 291 "
+            "479 525 423 525 498 305 471 525 230 239 455 230 799 525 527 525 525 "
+            "349 391 335 525 452 715 433 453 395 314 460 314 498"
+        ),
+        "Verdana": (
+            "352 394 459 818 636 1076 727 269 454 454 636 818 364 454 364 454 "
+            "636 636 636 636 636 636 636 636 636 636 454 454 818 818 818 545 1000 "
+            "684 686 698 771 632 575 775 751 421 455 693 557 843 748 787 603 787 "
+            "695 684 616 732 684 989 685 615 685 454 454 454 818 636 636 "
+            "601 623 521 623 596 352 623 633 274 344 592 274 973 633 607 623 623 "
+            "427 521 394 633 592 818 592 592 525 635 454 635 818"
+        ),
+    }
+    # Bold glyphs run about a tenth wider than the regular widths above
+    boldScale = 1.1
+    # Line height as a multiple of the font size, and the default margins of a
+    # PowerPoint table cell in points, left plus right and top plus bottom
+    lineHeight = 1.2
+    cellMargins = (14.4, 7.2)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def charWidths(font: str) -> tuple[dict[str, float], float]:
+        widths = [int(width) / 1000 for width in TextFit.widths[font].split()]
+        return (
+            {chr(32 + index): width for index, width in enumerate(widths)},
+            sum(widths) / len(widths),
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def textWidth(cls, text: str, font: str, bold: bool = False) -> float:
+        # Width of one line of text in ems, that is in points at a size of 1pt
+        widths, average = cls.charWidths(font)
+        width = sum(widths.get(char, average) for char in text)
+        return width * cls.boldScale if bold else width
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def fitTable(
+        cls,
+        rows: tuple[tuple[str, ...], ...],
+        font: str,
+        columnWidths: tuple[float, ...],
+        height: float,
+        maximum: int,
+        minimum: int,
+        bold: bool = True,
+    ) -> int | None:
+        # Largest whole font size in [minimum, maximum] at which the rows fit in
+        # height points, with each cell wrapped to its column width, or None if
+        # they do not fit even at minimum. Memoized on the table's texts and
+        # geometry.
+        def fits(size: int) -> bool:
+            return (
+                sum(cls.rowHeight(row, font, columnWidths, size, bold) for row in rows)
+                <= height
+            )
+
+        if not fits(minimum):
+            return None
+        low, high = minimum, maximum
+        while low < high:
+            middle = (low + high + 1) // 2
+            if fits(middle):
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    @classmethod
+    def rowHeight(
+        cls,
+        row: tuple[str, ...],
+        font: str,
+        columnWidths: tuple[float, ...],
+        size: int,
+        bold: bool = True,
+    ) -> float:
+        # Height in points of a table row at size points, as tall as its cell
+        # that wraps to the most lines
+        horizontal, vertical = cls.cellMargins
+        lines = max(
+            math.ceil(cls.textWidth(text, font, bold) * size / (width - horizontal))
+            for text, width in zip(row, columnWidths)
+        )
+        return max(lines, 1) * size * cls.lineHeight + vertical
+
+    @classmethod
+    def columnWidth(
+        cls, texts: Iterable[str], font: str, size: int, bold: bool = False
+    ) -> float:
+        # Excel column width for the widest text. Widths count characters of the
+        # default 11pt Calibri, 7 pixels each plus 5 pixels of cell padding.
+        widest = max((cls.textWidth(text, font, bold) for text in texts), default=0)
+        return (widest * size * 96 / 72 + 5) / 7
+
+
+# Word and PowerPoint templates, read from disk once per process and reopened
+# from memory. An entry is reread when the template file's mtime changes.
+class Templates(object):
+    # Path -> (mtime, file bytes)
+    cache = {}
+
+    @classmethod
+    def read(cls, template: str) -> bytes:
+        mtime = os.stat(template).st_mtime_ns
+        cached = cls.cache.get(template)
+        if cached is None or cached[0] != mtime:
+            with open(template, "rb") as file:
+                cached = cls.cache[template] = (mtime, file.read())
+        return cached[1]
+
+    @classmethod
+    def document(cls, template: str) -> Document:
+        return Document(io.BytesIO(cls.read(template)))
+
+    @classmethod
+    def presentation(cls, template: str) -> Presentation:
+        return Presentation(io.BytesIO(cls.read(template)))
+
+
+# Classroom sign documents, one .docx per day. Days are independent of each
+# other, so they are rendered by class-level functions a process pool can pickle.
+# docxDay builds each sign through python-docx and is the reference output.
+# xmlDay writes the same document.xml from fragments cut out of a sample sign.
+class ClassroomSigns(object):
+    # (location, template) -> (template bytes, compiled package)
+    packages = {}
+    # Placeholder text laid out in the sample sign, one per fragment slot
+    marker = "AUTOSIGNS_BODY"
+    slots = {
+        "heading": "AUTOSIGNS_HEADING",
+        "room": "AUTOSIGNS_ROOM",
+        "title": "AUTOSIGNS_TITLE",
+        "time": "AUTOSIGNS_TIME",
+    }
+    # Characters XML 1.0 does not allow, which lxml refuses in docxDay
+    illegalXML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+    @staticmethod
+    def GBCSetup(doc: Document) -> None:
+        # Set defaults for new file
+        paragraph_format = doc.styles["Normal"].paragraph_format
+        paragraph_format.space_before = 0
+        paragraph_format.space_after = 0
+        paragraph_format.line_spacing = 1
+        font = doc.styles["Normal"].font
+        font.name = "Times New Roman"
+        font.bold = True
+        font.size = Pt(4)
+
+        # Set page orientation, page size, and margins
+        for section in doc.sections:
+            section.orientation = WD_ORIENT.LANDSCAPE  # Landscape
+            section.page_width = 10058400  # Page Width = 11 inches
+            section.page_height = 7772400  # Page Height = 8.5 inches
+            section.left_margin = 457200  # Left Margin = 0.5 inches
+            section.right_margin = 457200  # Right Margin = 0.5 inches
+            section.top_margin = 457200  # Top Margin = 0.5 inches
+            section.bottom_margin = 457200  # Bottom Margin = 0.5 inches
+
+    @staticmethod
+    def GBCRoom(
+        doc: Document, heading: str, room: str, titles: list[str], times: list[str]
+    ) -> None:
+        # Add Date, Classroom number, section title and start/end time
+        para = doc.add_paragraph()
+        para.alignment = 1
+        run = para.add_run(heading)  # Date
+        run.font.size = Pt(48)
+
+        para = doc.add_paragraph()
+        para.alignment = 0
+        run = para.add_run(room)  # Classroom Number
+        run.font.size = Pt(36)
+
+        para = doc.add_paragraph()
+        para.alignment = 0
+        run = para.add_run("Class:")  # Class
+        run.font.size = Pt(36)
+
+        run = para.add_run("\n")
+        run.font.size = Pt(2)
+
+        table = doc.add_table(rows=1, cols=2)  # Create table to put each course
+        table.alignment = 2
+        table.allow_autofit = False
+
+        for index, (title, timeText) in enumerate(zip(titles, times)):
+            # add a row for each further course in the same classroom
+            row = table.rows[0] if index == 0 else table.add_row()
+            row.cells[0].text = f"{title}\n"
+            row.cells[1].text = timeText
+            for cell, width in zip(row.cells, (Inches(6.7), Inches(3.3))):
+                cell.width = width
+                for paragraph in cell.paragraphs:
+                    for run in paragraph.runs:
+                        run.font.size = Pt(22)
+
+    @staticmethod
+    def SFCSetup(doc: Document) -> None:
+        # Clear template content, set defaults for new file
+        doc._body.clear_content()
+        paragraph_format = doc.styles["Normal"].paragraph_format
+        paragraph_format.space_before = 0
+        paragraph_format.space_after = Pt(10)
+        font = doc.styles["Normal"].font
+        font.name = "Arial"
+        font.bold = False
+        font.size = Pt(1)
+
+        # Set page orientation, page size, and margins
+        for section in doc.sections:
+            section.orientation = WD_ORIENT.PORTRAIT  # Landscape
+            section.page_width = 7772400  # Page Width = 11 inches
+            section.page_height = 10058400  # Page Height = 8.5 inches
+            section.left_margin = 457200  # Left Margin = 0.5 inches
+            section.right_margin = 457200  # Right Margin = 0.5 inches
+            section.top_margin = 457200  # Top Margin = 0.5 inches
+            section.bottom_margin = 457200  # Bottom Margin = 0.5 inches
+
+    @staticmethod
+    def SFCRoom(
+        doc: Document, heading: str, room: str, titles: list[str], times: list[str]
+    ) -> None:
+        # Add Day, Classroom number, section title and start/end time
+        para = doc.add_paragraph()
+        para.alignment = 1
+        run = para.add_run(heading)  # Date
+        run.font.size = Pt(30)
+        # run.underline = True
+        run.bold = True
+
+        para = doc.add_paragraph()
+        para.alignment = 1
+        run = para.add_run(room)  # Classroom Number
+        run.font.size = Pt(24)
+
+        run = para.add_run("\n")
+        run.font.size = Pt(34)
+
+        table = doc.add_table(rows=1, cols=2)  # Create table to put each course
+        table.alignment = 2
+        table.allow_autofit = False
+
+        row = table.rows[0]
+        row.cells[0].text = "Course"
+        row.cells[0].paragraphs[0].runs[0].font.underline = True
+        row.cells[0].paragraphs[0].runs[0].font.bold = True
+        row.cells[0].paragraphs[0].runs[0].font.size = Pt(22)
+        row.cells[1].text = "Time"
+        row.cells[1].paragraphs[0].runs[0].font.underline = True
+        row.cells[1].paragraphs[0].runs[0].font.bold = True
+        row.cells[1].paragraphs[0].runs[0].font.size = Pt(22)
+        row.cells[0].width = Inches(5)
+        row.cells[1].width = Inches(3.3)
+
+        for title, timeText in zip(titles, times):
+            row = table.add_row()  # add a row for each course in the classroom
+            row.cells[0].text = f"{title}\n"
+            row.cells[1].text = timeText
+            row.cells[0].paragraphs[0].runs[0].font.size = Pt(22)
+            row.cells[1].paragraphs[0].runs[0].font.size = Pt(22)
+            row.cells[0].width = Inches(5)
+            row.cells[1].width = Inches(3.3)
+
+    @classmethod
+    def setup(cls, location: str, doc: Document) -> None:
+        if location == "SFC":
+            cls.SFCSetup(doc)
+        else:
+            cls.GBCSetup(doc)
+
+    @classmethod
+    def room(
+        cls,
+        location: str,
+        doc: Document,
+        heading: str,
+        room: str,
+        titles: list[str],
+        times: list[str],
+    ) -> None:
+        if location == "SFC":
+            cls.SFCRoom(doc, heading, room, titles, times)
+        else:
+            cls.GBCRoom(doc, heading, room, titles, times)
+
+    @staticmethod
+    def rooms(
+        location: str, date: pd.Timestamp, roomDays: list[RoomDay]
+    ) -> Iterator[tuple[str, str, list[str], list[str]]]:
+        # Heading, room label, section titles and times of each sign of the day
+        if location == "SFC":
+            heading, separator = Labels.weekday(date), " - "
+        else:
+            heading, separator = Labels.longDate(date), " to "
+        for roomDay in roomDays:
+            room = roomDay.room
+            if location == "SFC":
+                room = room.replace("Classroom", "Room")
+            titles = [section.title for section in roomDay.sections]
+            times = [
+                Labels.timeRange(section.start, section.end, separator)
+                for section in roomDay.sections
+            ]
+            yield heading, room, titles, times
+
+    @classmethod
+    def docxDay(
+        cls,
+        location: str,
+        template: str,
+        path: str,
+        date: pd.Timestamp,
+        roomDays: list[RoomDay],
+    ) -> str:
+        # Create Classroom Signs, one page per classroom
+        doc = Templates.document(template)
+        cls.setup(location, doc)
+        for index, sign in enumerate(cls.rooms(location, date, roomDays)):
+            if index != 0:
+                doc.add_page_break()  # Reached end of page, start new page
+            cls.room(location, doc, *sign)
+
+        # Save as Microsoft Word docx file for the day
+        doc.save(path)
+        return path
+
+    @classmethod
+    def xmlDay(
+        cls,
+        location: str,
+        template: str,
+        path: str,
+        date: pd.Timestamp,
+        roomDays: list[RoomDay],
+    ) -> str:
+        package = cls.package(location, template)
+        body = [package["head"]]
+        for index, (heading, room, titles, times) in enumerate(
+            cls.rooms(location, date, roomDays)
+        ):
+            if index != 0:
+                body.append(package["pageBreak"])
+            body.append(
+                cls.fill(
+                    package["room"],
+                    {"heading": cls.runText(heading), "room": cls.runText(room)},
+                )
+            )
+            for rowIndex, (title, timeText) in enumerate(zip(titles, times)):
+                body.append(
+                    cls.fill(
+                        package["firstRow" if rowIndex == 0 else "nextRow"],
+                        {"title": cls.runText(title), "time": cls.runText(timeText)},
+                    )
+                )
+            body.append("</w:tbl>")
+        body.append(package["tail"])
+
+        # Copy every other part of the prepared package unchanged
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as docx:
+            for name, data in package["parts"]:
+                if name == "word/document.xml":
+                    data = "".join(body).encode("utf-8")
+                docx.writestr(name, data)
+        return path
+
+    @classmethod
+    def package(cls, location: str, template: str) -> dict:
+        source = Templates.read(template)
+        cached = cls.packages.get((location, template))
+        if cached is not None and cached[0] is source:
+            return cached[1]
+
+        # Lay out a sample sign of two courses with placeholder text through the
+        # python-docx builder, behind a marker paragraph that splits the body
+        doc = Templates.document(template)
+        cls.setup(location, doc)
+        marker = doc.add_paragraph(cls.marker)._p
+        doc.add_page_break()
+        cls.room(
+            location,
+            doc,
+            cls.slots["heading"],
+            cls.slots["room"],
+            [cls.slots["title"]] * 2,
+            [cls.slots["time"]] * 2,
+        )
+        sample = []
+        element = marker.getnext()
+        while element is not None and element.tag != qn("w:sectPr"):
+            sample.append(element)
+            element = element.getnext()
+
+        # Fragments are serialized on their own, so drop the namespace
+        # declarations the document root already carries
+        pageBreak, *paragraphs, table = [
+            re.sub(
+                r' xmlns:\w+="[^"]*"', "", etree.tostring(element, encoding="unicode")
+            )
+            for element in sample
+        ]
+        rows = [match.start() for match in re.finditer(r"<w:tr[ >]", table)]
+        for element in sample:
+            element.getparent().remove(element)
+
+        stream = io.BytesIO()
+        doc.save(stream)
+        with zipfile.ZipFile(stream) as docx:
+            parts = [(info.filename, docx.read(info)) for info in docx.infolist()]
+        head, tail = (
+            dict(parts)["word/document.xml"]
+            .decode("utf-8")
+            .split(f"<w:p><w:r><w:t>{cls.marker}</w:t></w:r></w:p>")
+        )
+        package = {
+            "parts": parts,
+            "head": head,
+            "tail": tail,
+            "pageBreak": pageBreak,
+            "room": cls.compile("".join(paragraphs) + table[: rows[-2]]),
+            "firstRow": cls.compile(table[rows[-2] : rows[-1]]),
+            "nextRow": cls.compile(table[rows[-1] : -len("</w:tbl>")]),
+        }
+        cls.packages[(location, template)] = (source, package)
+        return package
+
+    @classmethod
+    def compile(cls, fragment: str) -> list[str]:
+        # Alternating literal XML and slot names
+        names = {text: name for name, text in cls.slots.items()}
+        pieces = re.split(r"<w:t>(AUTOSIGNS_\w+)</w:t>", fragment)
+        return [
+            names[piece] if index % 2 else piece for index, piece in enumerate(pieces)
+        ]
+
+    @staticmethod
+    def fill(pieces: list[str], values: dict[str, str]) -> str:
+        return "".join(
+            values[piece] if index % 2 else piece for index, piece in enumerate(pieces)
+        )
+
+    @classmethod
+    def runText(cls, text: str) -> str:
+        # Run content as python-docx writes it: tabs and line breaks become their
+        # own elements, and text with outer whitespace is marked to preserve it.
+        # Text Word could not open is rejected with the error docxDay raises.
+        if cls.illegalXML.search(text):
+            raise ValueError(
+                "All strings must be XML compatible: Unicode or ASCII, no NULL "
+                "bytes or control characters"
+            )
+        content = []
+        for index, part in enumerate(re.split(r"(\t|\r|\n)", text)):
+            if index % 2:
+                content.append("<w:tab/>" if part == "\t" else "<w:br/>")
+            elif part:
+                space = ' xml:space="preserve"' if part.strip() != part else ""
+                content.append(f"<w:t{space}>{escape(part)}</w:t>")
+        return "".join(content)
+
+
+# TV slide decks, one .pptx per day with a slide per time of day block. Like the
+# classroom signs, each day is rendered by a class-level function for the pool.
+class SlideDecks(object):
+    # Block table rows alternate white and #FAC090, headings are yellow
+    rowColors = (RGBColor(0xFF, 0xFF, 0xFF), RGBColor(0xFA, 0xC0, 0x90))
+    headingColor = RGBColor(0xFF, 0xFF, 0x00)
+    # Smallest font a paginated block table is shrunk to, in points
+    minimumFontSize = 24
+
+    @classmethod
+    def GBCDay(
+        cls, template: str, path: str, date: pd.Timestamp, day: list[Section]
+    ) -> str:
+        headings = {
+            "Morning": f"UC Berkeley Extension {Labels.fullDate(date)}",
+            "Afternoon": (
+                f"UC Berkeley Extension {Labels.weekday(date)} "
+                f"{Labels.longDate(date)}"
+            ),
+            "Evening": (
+                f"UC Berkeley Extension {Labels.weekday(date)} "
+                f"{Labels.longDate(date)}"
+            ),
+        }
+        prs = Templates.presentation(template)
+        blocks = Schedule.partition(day, "block", "GBC")
+        blockSlides = [prs.slides[index + 1] for index in range(len(blocks))]
+
+        # Write out schedule one block per slide, adding copies of the slide when
+        # a block does not fit on one. Hide slide if no classes.
+        for slide, (label, block) in zip(blockSlides, blocks.items()):
+            if not block:
+                slide._element.set("show", "0")
+                continue
+            values = Labels.rows(
+                block, ["start", "end", "title", "instructorLabel", "room"]
+            )
+
+            # Fit the font to the table below its header row, at most 65pt. A
+            # block that needs less than the minimum font is split over slides,
+            # and every slide of the block gets the size its tallest page fits.
+            columnWidths, height = cls.tableGeometry(prs, slide.shapes[0], 1)
+
+            def fitPage(page: list[list[str]]) -> int | None:
+                return TextFit.fitTable(
+                    tuple(map(tuple, page)),
+                    "Calibri",
+                    columnWidths,
+                    height,
+                    65,
+                    cls.minimumFontSize,
+                )
+
+            pages = cls.paginate(
+                values,
+                len(slide.shapes[0].table.rows) - 1,
+                lambda page: fitPage(page) is not None,
+            )
+            sizes = [fitPage(page) for page in pages]
+            # Only a single row too tall for a whole slide is left not fitting
+            fontSize = cls.minimumFontSize if None in sizes else min(sizes)
+            position = prs.slides.index(slide)
+            slides = [slide] + [
+                cls.cloneSlide(prs, slide, position + offset)
+                for offset in range(1, len(pages))
+            ]
+            for pageSlide, page in zip(slides, pages):
+                cls.setHeading(pageSlide, headings[label], 120)
+                cls.fillRows(pageSlide.shapes[0].table, 1, page, fontSize, "Calibri")
+
+        # Save as Microsoft Powerpoint pptx file for the day
+        prs.save(path)
+        return path
+
+    @classmethod
+    def SFCDay(
+        cls, template: str, path: str, date: pd.Timestamp, day: list[Section]
+    ) -> str:
+        prs = Templates.presentation(template)
+
+        # Write out schedule one block per slide, grouped by floor. Hide slide if
+        # no classes.
+        blocks = Schedule.partition(
+            sorted(day, key=operator.attrgetter("room", "start")), "block", "SFC"
+        )
+        for index, block in enumerate(blocks.values()):
+            slide = prs.slides[index + 1]
+            if not block:
+                slide._element.set("show", "0")
+                continue
+            floors = {
+                floor: Labels.rows(
+                    rows, ["start", "end", "number", "title", "roomNumber"]
+                )
+                for floor, rows in Schedule.partition(block, "floor", "SFC").items()
+            }
+
+            # Fit the font to the table, at most 60pt, with a heading row per floor
+            # and a blank row after all but the last. SFC slides are not
+            # paginated, so the font shrinks to fit down to 8pt, and a block too
+            # long even then is set at 8pt.
+            layout = []
+            for floor, values in floors.items():
+                if values:
+                    if layout:
+                        layout.append(("",) * 5)
+                    layout += [(floor, "", "", "", "Room"), *map(tuple, values)]
+            columnWidths, height = cls.tableGeometry(prs, slide.shapes[0], 0)
+            fontSize = (
+                TextFit.fitTable(tuple(layout), "Arial", columnWidths, height, 60, 8)
+                or 8
+            )
+
+            cls.setHeading(
+                slide, f"UC Berkeley Extension - {Labels.fullDate(date)}", 70
+            )
+            table = slide.shapes[0].table
+            currentRow = 0
+            for floor, values in floors.items():
+                if not values:
+                    continue
+                paragraph = table.cell(currentRow, 0).text_frame.paragraphs[0]
+                heading = cls.runPrototype(
+                    paragraph, fontSize, "Arial", cls.headingColor, underline=True
+                )
+                cls.addRun(table.cell(currentRow, 0), heading, floor)
+                cls.addRun(table.cell(currentRow, 4), heading, "Room")
+                currentRow = (
+                    cls.fillRows(table, currentRow + 1, values, fontSize, "Arial") + 1
+                )
+
+        # Save as Microsoft Powerpoint pptx file for the day
+        prs.save(path)
+        return path
+
+    @staticmethod
+    def paginate(
+        rows: list[list[str]],
+        capacity: int,
+        fits: Callable[[list[list[str]]], bool],
+    ) -> list[list[list[str]]]:
+        # Split a block's rows evenly over as few slides as they fit on. A slide
+        # holds no more rows than its table has, and the split grows a slide at
+        # a time until every page fits at the minimum font size, wrapped lines
+        # included. A row alone on its slide always counts as fitting.
+        pages = -(-len(rows) // max(1, capacity))
+        while True:
+            bounds = [len(rows) * page // pages for page in range(pages + 1)]
+            split = [rows[start:stop] for start, stop in zip(bounds, bounds[1:])]
+            if pages >= len(rows) or all(fits(page) for page in split):
+                return split
+            pages += 1
+
+    @staticmethod
+    def tableGeometry(prs, frame, firstRow: int) -> tuple[tuple[float, ...], float]:
+        # Column widths of a table and the height from its firstRow to the bottom
+        # of the slide, in points
+        table = frame.table
+        top = frame.top + sum(row.height for row in list(table.rows)[:firstRow])
+        return (
+            tuple(column.width / Pt(1) for column in table.columns),
+            (prs.slide_height - top) / Pt(1),
+        )
+
+    @staticmethod
+    def cloneSlide(prs, slide, position: int):
+        # python-pptx cannot copy a slide, so add one on the same layout, give it
+        # copies of the source slide's shapes, background and relationships, and
+        # move it into position in the slide list
+        clone = prs.slides.add_slide(slide.slide_layout)
+        spTree = clone.shapes._spTree
+        for shape in list(spTree):
+            spTree.remove(shape)
+        for shape in slide.shapes._spTree:
+            spTree.append(copy.deepcopy(shape))
+        if slide._element.cSld.bg is not None:
+            clone._element.cSld.insert(0, copy.deepcopy(slide._element.cSld.bg))
+        for name, value in slide._element.attrib.items():
+            clone._element.set(name, value)
+
+        rels = clone.part.rels
+        rels.clear()
+        rels._target_parts_by_rId.clear()
+        for rId, rel in slide.part.rels.items():
+            if rel.reltype != RT.NOTES_SLIDE:
+                rels.add_relationship(rel.reltype, rel._target, rId, rel.is_external)
+
+        sldIdLst = prs.slides._sldIdLst
+        sldIdLst.insert(position, sldIdLst[-1])
+        return clone
+
+    @classmethod
+    def setHeading(cls, slide, text: str, size: int) -> None:
+        text_frame = slide.shapes[2].text_frame
+        text_frame.clear()
+        p = text_frame.paragraphs[0]
+        run = p.add_run()
+        run.text = text
+        font = run.font
+        font.size = Pt(size)
+        font.name = "Calibri"
+        font.bold = True
+        font.color.rgb = cls.headingColor
+
+    @staticmethod
+    def runPrototype(
+        paragraph, size: int, name: str, color: RGBColor, underline: bool = False
+    ) -> CT_RegularTextRun:
+        # Style a run once through python-pptx, then detach it as a template
+        run = paragraph.add_run()
+        font = run.font
+        font.size = Pt(size)
+        font.name = name
+        font.bold = True
+        if underline:
+            font.underline = True
+        font.color.rgb = color
+        paragraph._p.remove(run._r)
+        return run._r
+
+    @staticmethod
+    def addRun(cell, prototype: CT_RegularTextRun, text: str) -> None:
+        run = copy.deepcopy(prototype)
+        run.text = text
+        cell.text_frame.paragraphs[0]._p._insert_r(run)
+
+    @classmethod
+    def fillRows(
+        cls, table, firstRow: int, rows: list[list[str]], size: int, name: str
+    ) -> int:
+        # Fill consecutive table rows starting from a white row. Every cell gets
+        # a copy of its row color's prototype run, so each style is built once
+        # per table instead of once per cell. Returns the row after the last.
+        paragraph = table.cell(firstRow, 0).text_frame.paragraphs[0]
+        prototypes = [
+            cls.runPrototype(paragraph, size, name, color) for color in cls.rowColors
+        ]
+        for offset, values in enumerate(rows):
+            prototype = prototypes[offset % 2]
+            for cell, text in zip(table.rows[firstRow + offset].cells, values):
+                cls.addRun(cell, prototype, text)
+        return firstRow + len(rows)
+
+
+# Daily schedule worksheets, one per day. A day is written top to bottom, one
+# row after another, so sheets can be streamed in constant memory mode.
+class DailySchedules(object):
+    # Cell formats per center, added once per workbook and shared by every sheet
+    formatSpecs = {
+        "GBC": {
+            "title": {
+                "font_name": "Verdana",
+                "font_size": 18,
+                "bold": True,
+                "text_wrap": False,
+                "font_color": "#000000",
+            },
+            "header": {
+                "font_name": "Verdana",
+                "font_size": 18,
+                "bold": True,
+                "text_wrap": True,
+                "bottom": 2,
+                "bottom_color": "#000000",
+            },
+            "body": {
+                "font_name": "Verdana",
+                "font_size": 18,
+                "bold": False,
+                "valign": "top",
+                "text_wrap": True,
+                "font_color": "#000000",
+            },
+        },
+        "SFC": {
+            "title": {
+                "font_name": "Arial",
+                "font_size": 30,
+                "align": "center",
+                "bold": True,
+                "text_wrap": False,
+                "font_color": "red",
+                "underline": True,
+            },
+            "blank": {
+                "font_name": "Arial",
+                "font_size": 8,
+            },
+            "header": {
+                "font_name": "Arial",
+                "font_size": 24,
+                "bold": True,
+                "text_wrap": True,
+                "underline": True,
+            },
+            "block": {
+                "font_name": "Arial",
+                "font_size": 24,
+                "bold": True,
+                "text_wrap": False,
+                "align": "left",
+                "valign": "top",
+                "underline": True,
+            },
+            "body": {
+                "font_name": "Arial",
+                "font_size": 21,
+                "bold": False,
+                "valign": "top",
+                "text_wrap": True,
+                "font_color": "#000000",
+            },
+        },
+    }
+    columns = {
+        "GBC": [
+            "Start Time",
+            "End Time",
+            "Section Number",
+            "Section Title",
+            "Instructor",
+            "Room",
+        ],
+        "SFC": ["Start Time", "End Time", "Section Number", "Section Title", "Room"],
+    }
+    # Section fields shown in those columns
+    fields = {
+        "GBC": ["start", "end", "number", "title", "instructorLabel", "room"],
+        "SFC": ["start", "end", "number", "title", "roomNumber"],
+    }
+
+    @staticmethod
+    def pageSetup(worksheet, landscape: bool) -> None:
+        if landscape:
+            worksheet.set_landscape()  # Page orientation as landscape.
+            worksheet.hide_gridlines(0)  # Don’t hide gridlines.
+        else:
+            worksheet.set_portrait()
+        worksheet.fit_to_pages(1, 1)  # Fit to 1x1 pages.
+        worksheet.center_horizontally()
+        worksheet.center_vertically()
+        worksheet.set_paper(1)  # Set paper size to 8.5" x 11"
+        worksheet.set_margins(left=0.25, right=0.25, top=0.25, bottom=0.25)
+        worksheet.set_header("", {"margin": 0})
+        worksheet.set_footer("", {"margin": 0})
+
+    @staticmethod
+    def writeRows(worksheet, firstRow: int, rows: list[list[str]], cellFormat) -> int:
+        # One write_row per section. Returns the row after the last.
+        for offset, values in enumerate(rows):
+            worksheet.write_row(firstRow + offset, 0, values, cellFormat)
+        return firstRow + len(rows)
+
+    @classmethod
+    def GBCSheet(
+        cls,
+        workbook: xlsxwriter.Workbook,
+        formats: dict,
+        date: pd.Timestamp,
+        day: list[Section],
+    ) -> None:
+        worksheet = workbook.add_worksheet(Labels.isoDate(date))
+        cls.pageSetup(worksheet, landscape=True)
+        worksheet.set_column("A:A", 21.5)  # Column A (Start Time) width set to 23.
+        worksheet.set_column("B:B", 19)  # Column B (End Time) width set to 19.
+        worksheet.set_column("D:D", 64)  # Column D (Section Title) width set to 64.
+
+        worksheet.write(0, 0, "UC Berkeley Extension", formats["title"])
+        worksheet.write(
+            0,
+            4,
+            (f"{Labels.weekday(date)} {Labels.longDate(date)}"),
+            formats["title"],
+        )
+        worksheet.write_row(2, 0, cls.columns["GBC"], formats["header"])
+
+        # One heading and its rows per block, with a blank row between blocks
+        excelRow = 3
+        for label, block in Schedule.partition(day, "block", "GBC").items():
+            if not block:
+                continue
+            if excelRow > 3:
+                excelRow += 1
+            worksheet.write(excelRow, 0, f"{label} Classes", formats["title"])
+            excelRow = cls.writeRows(
+                worksheet,
+                excelRow + 1,
+                Labels.rows(block, cls.fields["GBC"]),
+                formats["body"],
+            )
+
+        # Fit columns to their widest text, never narrower than the header.
+        # Instructor names over 20 characters wrap instead of widening it.
+        instructors = {section.instructor for section in day}
+        for column, header, texts in (
+            (
+                "C:C",
+                "Section Number",
+                {section.number for section in day},
+            ),
+            ("E:E", "Instructor", [name for name in instructors if len(name) <= 20]),
+            ("F:F", "Room", {section.room for section in day}),
+        ):
+            worksheet.set_column(
+                column,
+                max(
+                    TextFit.columnWidth([header], "Verdana", 18, bold=True),
+                    TextFit.columnWidth(texts, "Verdana", 18),
+                ),
+            )
+
+    @classmethod
+    def SFCSheet(
+        cls,
+        workbook: xlsxwriter.Workbook,
+        formats: dict,
+        date: pd.Timestamp,
+        day: list[Section],
+    ) -> None:
+        worksheet = workbook.add_worksheet(Labels.isoDate(date))
+        cls.pageSetup(worksheet, landscape=False)
+        worksheet.set_column("A:B", 18.57)
+        worksheet.set_column("C:C", 43)
+        worksheet.set_column("D:D", 100)
+        worksheet.set_column("E:E", 13.86)
+
+        # Title and header rows
+        worksheet.merge_range(
+            "A1:E1",
+            (f"UC Berkeley Extension - {Labels.fullDate(date)}"),
+            formats["title"],
+        )
+        worksheet.write_row(1, 0, cls.columns["SFC"], formats["header"])
+
+        # Write daytime then evening courses, by floor, with a blank row after
+        # every floor but the evening 7th. The block headings span two rows, so
+        # in constant memory mode their blank C:E merge is dropped once the A:B
+        # merge has flushed the first row.
+        excelRow = 2
+        worksheet.merge_range(excelRow, 0, excelRow, 4, "", formats["blank"])
+        blocks = Schedule.partition(
+            sorted(day, key=operator.attrgetter("room", "start")), "block", "SFC"
+        )
+        for label, block in blocks.items():
+            if not block:
+                continue
+            excelRow += 1
+            worksheet.merge_range(
+                excelRow, 0, excelRow + 1, 1, f"{label} Classes", formats["block"]
+            )
+            worksheet.merge_range(excelRow, 2, excelRow + 1, 4, "", formats["block"])
+            excelRow += 1
+
+            for floor, rows in Schedule.partition(block, "floor", "SFC").items():
+                if not rows:
+                    continue
+                excelRow += 1
+                worksheet.merge_range(excelRow, 0, excelRow, 1, floor, formats["block"])
+                worksheet.merge_range(excelRow, 2, excelRow, 4, "", formats["block"])
+                excelRow = cls.writeRows(
+                    worksheet,
+                    excelRow + 1,
+                    Labels.rows(rows, cls.fields["SFC"]),
+                    formats["body"],
+                )
+                if (label, floor) != ("Evening", "7th Floor"):
+                    worksheet.merge_range(
+                        excelRow, 0, excelRow, 4, "", formats["blank"]
+                    )
+
+    @classmethod
+    def formats(cls, location: str, workbook: xlsxwriter.Workbook) -> dict:
+        center = "SFC" if location == "SFC" else "GBC"
+        return {
+            name: workbook.add_format(spec)
+            for name, spec in cls.formatSpecs[center].items()
+        }
+
+    @classmethod
+    def sheet(
+        cls,
+        location: str,
+        workbook: xlsxwriter.Workbook,
+        formats: dict,
+        date: pd.Timestamp,
+        day: list[Section],
+    ) -> None:
+        if location == "SFC":
+            cls.SFCSheet(workbook, formats, date, day)
+        else:
+            cls.GBCSheet(workbook, formats, date, day)
+
+    @classmethod
+    def writeDay(
+        cls, location: str, path: str, date: pd.Timestamp, day: list[Section]
+    ) -> str:
+        # Workbook of a single day, for the worker pool
+        workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+        cls.sheet(location, workbook, cls.formats(location, workbook), date, day)
+        workbook.close()
+        return path
+
+
+# Whatever a Sheets request returns, passed through by ScheduleSheets.call
+Response = TypeVar("Response")
+
+
+# Live schedules in Google Sheets, which the lobby TV slides link to. Each
+# worksheet is laid out locally as a grid of values from A1, and an upload is
+# sent as one spreadsheets.batchUpdate that clears and sizes every worksheet
+# plus one values.batchUpdate that writes every grid. The grids of the last
+# upload are kept as a snapshot, so an upload can send only what changed.
+class ScheduleSheets(object):
+    header = ["Start Time", "End Time", "Section Title", "Instructor", "Room"]
+    fields = ["start", "end", "title", "instructor", "room"]
+    # One authorized client per process and the spreadsheets it has opened, by
+    # URL. The client's credentials keep their access token until it expires
+    # and its HTTP object keeps connections alive between uploads.
+    client = None
+    spreadsheets = {}
+    # Uploads run on this one background thread, alongside rendering and one
+    # at a time, so the shared client is only ever used from it
+    pool = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="sheets")
+    # Writes take a token from a bucket refilled at the per-user write quota of
+    # 60 requests a minute. Requests refused for quota (429) or by a server
+    # error (5xx) are retried after an exponential backoff with full jitter.
+    writesPerMinute = 60
+    writeBurst = 10
+    tokens = writeBurst
+    refilled = 0.0
+    attempts = 6
+    backoff = 1.0
+    maxBackoff = 32.0
+    # Failures to reach the API at all, including a TLS connection dropped
+    # while kept alive and a token refresh that could not connect
+    transientErrors = (
+        ConnectionError,
+        TimeoutError,
+        ssl.SSLError,
+        httplib2.ServerNotFoundError,
+        TransportError,
+    )
+
+    @classmethod
+    def open(cls, url: str) -> pygsheets.Spreadsheet:
+        if cls.client is None:
+            # Retries are left to call, pygsheets would sleep 100s on a 429
+            cls.client = pygsheets.authorize(
+                service_file=f"{os.getcwd()}/service_file.json",
+                retries=0,
+                check=False,
+            )
+        if url not in cls.spreadsheets:
+            cls.spreadsheets[url] = cls.call(
+                lambda: cls.client.open_by_url(url), write=False
+            )
+        return cls.spreadsheets[url]
+
+    @classmethod
+    def call(cls, request: Callable[[], Response], write: bool = True) -> Response:
+        # Every request sent sets whole ranges to fixed values, so one that
+        # failed, or went through without an answer, is safe to send again
+        for attempt in range(cls.attempts):
+            if write:
+                cls.takeToken()
+            try:
+                return request()
+            except HttpError as error:
+                status = int(error.resp.status)
+                if status != 429 and status < 500 or attempt == cls.attempts - 1:
+                    raise
+                retryAfter = error.resp.get("retry-after", "")
+            except cls.transientErrors:
+                if attempt == cls.attempts - 1:
+                    raise
+                retryAfter = ""
+            delay = random.uniform(0, min(cls.maxBackoff, cls.backoff * 2**attempt))
+            if retryAfter.isdigit():
+                delay = max(delay, float(retryAfter))
+            time.sleep(delay)
+
+    @classmethod
+    def takeToken(cls) -> None:
+        # Refill for the time since the last write, up to the burst size, and
+        # wait for the rest of a token if less than one is left
+        now = time.monotonic()
+        cls.tokens = min(
+            cls.writeBurst,
+            cls.tokens + (now - cls.refilled) * cls.writesPerMinute / 60,
+        )
+        cls.refilled = now
+        if cls.tokens < 1:
+            time.sleep((1 - cls.tokens) * 60 / cls.writesPerMinute)
+            cls.tokens, cls.refilled = 1, time.monotonic()
+        cls.tokens -= 1
+
+    @classmethod
+    def GBCGrids(
+        cls, date: datetime.date, sections: list[Section]
+    ) -> dict[str, list[list[str]]]:
+        # One worksheet per block with a title, the header and its sections
+        title = f"UC Berkeley Extension - {Labels.fullDate(date)}"
+        return {
+            label: [[title], cls.header, *Labels.rows(block, cls.fields, padded=True)]
+            for label, block in Schedule.partition(sections, "block", "GBC").items()
+        }
+
+    @classmethod
+    def SFCGrids(
+        cls, date: datetime.date, sections: list[Section]
+    ) -> dict[str, list[list[str]]]:
+        # One worksheet per block with a title and the header, then a heading
+        # row, the sections and a blank row for each floor with classes
+        title = f"UC Berkeley Extension - {Labels.fullDate(date)}"
+        blocks = Schedule.partition(
+            sorted(sections, key=operator.attrgetter("room", "start")), "block", "SFC"
+        )
+        grids = {}
+        for label, block in blocks.items():
+            grid = grids[label] = [[title], cls.header]
+            for floor, rows in Schedule.partition(block, "floor", "SFC").items():
+                if rows:
+                    grid += [[floor], *Labels.rows(rows, cls.fields, padded=True), []]
+        return grids
+
+    @classmethod
+    def push(
+        cls,
+        sheet: pygsheets.Spreadsheet,
+        grids: dict[str, list[list[str]]],
+        sizes: dict[str, tuple[int, int]],
+        snapshotPath: str,
+        diff: bool = False,
+    ) -> None:
+        # In diff mode a worksheet the same size as in the snapshot only gets
+        # the ranges that changed. Any other worksheet is cleared, sized and
+        # written whole.
+        previous = cls.readSnapshot(snapshotPath) if diff else {}
+        # Forget the snapshot until this upload has gone through, so a failed
+        # upload is followed by a full rewrite
+        cls.writeSnapshot(snapshotPath, None)
+        try:
+            cls.send(sheet, grids, sizes, previous)
+        except Exception:
+            # The worksheets may have changed since the spreadsheet was opened
+            cls.spreadsheets = {
+                url: opened
+                for url, opened in cls.spreadsheets.items()
+                if opened is not sheet
+            }
+            raise
+        cls.writeSnapshot(
+            snapshotPath,
+            {
+                title: {"size": list(sizes[title]), "grid": grid}
+                for title, grid in grids.items()
+            },
+        )
+
+    @classmethod
+    def send(
+        cls,
+        sheet: pygsheets.Spreadsheet,
+        grids: dict[str, list[list[str]]],
+        sizes: dict[str, tuple[int, int]],
+        previous: dict,
+    ) -> None:
+        # Worksheet lookups are served from the metadata open_by_url fetched
+        requests, data = [], []
+        for title, grid in grids.items():
+            rows, cols = sizes[title]
+            last = previous.get(title)
+            if last is not None and last["size"] == [rows, cols]:
+                data += cls.changedRanges(title, last["grid"], grid, cols)
+                continue
+            sheetId = sheet.worksheet_by_title(title).id
+            requests += [
+                {"updateCells": {"range": {"sheetId": sheetId}, "fields": "*"}},
+                {
+                    "updateSheetProperties": {
+                        "properties": {
+                            "sheetId": sheetId,
+                            "gridProperties": {"rowCount": rows, "columnCount": cols},
+                        },
+                        "fields": "gridProperties.rowCount,gridProperties.columnCount",
+                    }
+                },
+            ]
+            data.append(
+                {"range": f"'{title}'!A1", "majorDimension": "ROWS", "values": grid}
+            )
+        # Each batch is applied whole or not at all, so a retry never finds a
+        # worksheet half cleared or half written
+        spreadsheets = sheet.client.sheet.service.spreadsheets()
+        if requests:
+            body = {"requests": requests}
+            cls.call(
+                spreadsheets.batchUpdate(spreadsheetId=sheet.id, body=body).execute
+            )
+        if data:
+            body = {"valueInputOption": "USER_ENTERED", "data": data}
+            cls.call(
+                spreadsheets.values()
+                .batchUpdate(spreadsheetId=sheet.id, body=body)
+                .execute
+            )
+
+    @staticmethod
+    def changedRanges(
+        title: str, old: list[list[str]], new: list[list[str]], cols: int
+    ) -> list[dict]:
+        # Each run of consecutive changed rows is written as one range over the
+        # columns that changed in it. Cells that were emptied are written blank.
+        def cells(grid: list[list[str]], row: int) -> list[str]:
+            values = grid[row] if row < len(grid) else []
+            return values + [""] * (cols - len(values))
+
+        changed = {}
+        for row in range(max(len(old), len(new))):
+            before, after = cells(old, row), cells(new, row)
+            columns = [col for col in range(cols) if before[col] != after[col]]
+            if columns:
+                changed[row] = (columns[0], columns[-1])
+
+        ranges = []
+        for _, run in itertools.groupby(
+            enumerate(changed), key=lambda item: item[1] - item[0]
+        ):
+            rows = [row for _, row in run]
+            first = min(changed[row][0] for row in rows)
+            last = max(changed[row][1] for row in rows)
+            ranges.append(
+                {
+                    "range": f"'{title}'!{xl_rowcol_to_cell(rows[0], first)}:"
+                    f"{xl_rowcol_to_cell(rows[-1], last)}",
+                    "majorDimension": "ROWS",
+                    "values": [cells(new, row)[first : last + 1] for row in rows],
+                }
+            )
+        return ranges
+
+    @staticmethod
+    def readSnapshot(snapshotPath: str) -> dict:
+        try:
+            with open(snapshotPath, encoding="utf-8") as snapshot:
+                return json.load(snapshot)
+        except (OSError, ValueError):  # No usable snapshot, write everything
+            return {}
+
+    @staticmethod
+    def writeSnapshot(snapshotPath: str, grids: dict | None) -> None:
+        # None removes the snapshot. Snapshots are best effort, like the
+        # schedule cache, and never fail an upload.
+        try:
+            if grids is None:
+                if os.path.exists(snapshotPath):
+                    os.remove(snapshotPath)
+                return
+            os.makedirs(os.path.dirname(snapshotPath), exist_ok=True)
+            with open(f"{snapshotPath}.tmp", "w", encoding="utf-8") as snapshot:
+                json.dump(grids, snapshot)
+            os.replace(f"{snapshotPath}.tmp", snapshotPath)
+        except OSError as error:
+            print(error)
+
+
 # Main Window for GUI
 class Ui_mainWindow(object):
     # Global variables and flags
@@ -45,6 +1592,11 @@ class Ui_mainWindow(object):
     GBCPptTemplate = os.path.join(current_folder, "Template-GBC.pptx")
     SFCTemplate = os.path.join(current_folder, "Template-SFC.docx")
     SFCPptTemplate = os.path.join(current_folder, "Template-SFC.pptx")
+    # Parsed reports are cached by content hash. Bump the parser version whenever
+    # loadSchedule changes the shape of the frame it returns.
+    scheduleCacheDirectory = os.path.join(current_folder, "cache")
+    scheduleCacheEntries = 20
+    scheduleParserVersion = 3
     genReport = False
     startDate = "2018-01-01"
     endDate = "2018-01-01"
@@ -61,6 +1613,11 @@ class Ui_mainWindow(object):
     GBCScheduleURL = ""
     uploadSFCSchedule = False
     SFCScheduleURL = ""
+    renderWorkers = 0
+    renderPool = None
+    signBackend = "xml"
+    dailyScheduleMode = "workbook"
+    sheetsSync = "full"
     center = {
         "Golden Bear Center": {
             "campus": "Berkeley - CA0001",
@@ -89,6 +1646,8 @@ class Ui_mainWindow(object):
 
     def __init__(self) -> None:
         super().__init__()
+        # Background Google Sheets uploads of the current run
+        self.uploads = []
         # Initialize settings from config.ini file, otherwise set default
         self.settings = QtCore.QSettings("config.ini", QtCore.QSettings.IniFormat)
         self.genReport = self.settings.value("genReport", True, type=bool)
@@ -119,6 +1678,17 @@ class Ui_mainWindow(object):
         )
         self.GBCScheduleURL = self.settings.value("GBCScheduleURL", "", type=str)
         self.SFCScheduleURL = self.settings.value("SFCScheduleURL", "", type=str)
+        # renderWorkers was called signWorkers before it covered every output
+        self.renderWorkers = self.settings.value(
+            "renderWorkers",
+            self.settings.value("signWorkers", 0, type=int),
+            type=int,
+        )
+        self.signBackend = self.settings.value("signBackend", "xml", type=str)
+        self.dailyScheduleMode = self.settings.value(
+            "dailyScheduleMode", "workbook", type=str
+        )
+        self.sheetsSync = self.settings.value("sheetsSync", "full", type=str)
 
     def setupUi(self, mainWindow: QtWidgets.QWidget) -> None:
         # global startDate, endDate
@@ -831,6 +2401,11 @@ class Ui_mainWindow(object):
             self.settings.setValue("GBCScheduleURL", self.GBCScheduleURL)
             self.settings.setValue("uploadSFCSchedule", self.uploadSFCSchedule)
             self.settings.setValue("SFCScheduleURL", self.SFCScheduleURL)
+            self.settings.setValue("renderWorkers", self.renderWorkers)
+            self.settings.remove("signWorkers")
+            self.settings.setValue("signBackend", self.signBackend)
+            self.settings.setValue("dailyScheduleMode", self.dailyScheduleMode)
+            self.settings.setValue("sheetsSync", self.sheetsSync)
             sys.exit()
         else:
             pass
@@ -942,33 +2517,9 @@ class Ui_mainWindow(object):
                     )
                     return
                 else:
-                    if (
-                        self.classroomSignsOutput
-                        and self.createSignsFunction(
-                            f"{self.saveReportToPath}\\SectionScheduleDailySummary.xls"
-                        )
-                        == 0
-                    ):
-                        result = 0
-                        pass
-                    if (
-                        self.dailyScheduleOutput
-                        and self.createDailySchedule(
-                            f"{self.saveReportToPath}\\SectionScheduleDailySummary.xls"
-                        )
-                        == 0
-                    ):
-                        result = 0
-                        pass
-                    if (
-                        self.powerpointOutput
-                        and self.createPPT(
-                            f"{self.saveReportToPath}\\SectionScheduleDailySummary.xls"
-                        )
-                        == 0
-                    ):
-                        result = 0
-                        pass
+                    result = self.createOutputs(
+                        f"{self.saveReportToPath}\\SectionScheduleDailySummary.xls"
+                    )
 
             elif self.useExistingReport and os.path.exists(self.existingReportPath):
                 if any((c in chars) for c in self.saveSignsDirectory[2:]):
@@ -997,24 +2548,7 @@ class Ui_mainWindow(object):
                     )
                     return
                 else:
-                    if (
-                        self.classroomSignsOutput
-                        and self.createSignsFunction(self.existingReportPath) == 0
-                    ):
-                        result = 0
-                        pass
-                    if (
-                        self.dailyScheduleOutput
-                        and self.createDailySchedule(self.existingReportPath) == 0
-                    ):
-                        result = 0
-                        pass
-                    if (
-                        self.powerpointOutput
-                        and self.createPPT(self.existingReportPath) == 0
-                    ):
-                        result = 0
-                        pass
+                    result = self.createOutputs(self.existingReportPath)
 
             elif self.existingReportPath == "" or not os.path.exists(
                 self.existingReportPath
@@ -1085,7 +2619,7 @@ class Ui_mainWindow(object):
             browser.quit()
             return 0
 
-    def createSignsFunction(self, reportPath: str) -> int:
+    def loadSchedule(self, reportPath: str) -> pd.DataFrame:
         # Read in courses from Excel
         # 1     B   Date
         # 3     D   Type
@@ -1102,7 +2636,22 @@ class Ui_mainWindow(object):
         # 20    U   Notes
         # 22    W   Approval Status
 
-        # Read into Pandas dataframe for relevant columns
+        # Reuse the parsed report if this exact file has been read before
+        cachePath = self.scheduleCachePath(reportPath)
+        if os.path.exists(cachePath):
+            try:
+                schedule = pd.read_pickle(cachePath)
+            except Exception:  # Corrupt or unreadable cache entry, parse again
+                pass
+            else:
+                # Mark the entry as recently used so eviction keeps it
+                try:
+                    os.utime(cachePath)
+                except OSError as error:
+                    print(error)
+                return schedule
+
+        # Read into Pandas dataframe for the columns used by every output
         pd.set_option("display.max_rows", 500)
         pd.set_option("display.max_columns", 500)
         pd.set_option("display.width", 1000)
@@ -1110,7 +2659,7 @@ class Ui_mainWindow(object):
             reportPath,
             header=6,
             skipfooter=1,
-            usecols=[1, 4, 6, 11, 13, 15, 22],
+            usecols=[1, 4, 6, 9, 11, 12, 13, 15, 22],
             parse_dates=[1, "Start Time", "End Time"],
             date_format={
                 "Date": "%Y/%m/%d %H:%M:%S",
@@ -1118,1002 +2667,231 @@ class Ui_mainWindow(object):
                 "End Time": "%I:%M%p",
             },
         )
-        schedule = schedule[schedule["Approval Status"] == "Final Approval"].copy()
+        schedule = schedule[schedule["Approval Status"] == "Final Approval"]
+        center = (
+            self.centerReverse[schedule["Building"].iloc[0]]["name"]
+            if not schedule.empty
+            else None
+        )
+        schedule = Schedule.fromReport(schedule, center)
+        self.saveScheduleCache(cachePath, schedule)
+        return schedule
+
+    def scheduleCachePath(self, reportPath: str) -> str:
+        # Key the cache on the report bytes and the parser version
+        digest = hashlib.sha256(f"v{self.scheduleParserVersion}".encode())
+        with open(reportPath, "rb") as report:
+            for chunk in iter(lambda: report.read(1 << 20), b""):
+                digest.update(chunk)
+        return os.path.join(self.scheduleCacheDirectory, f"{digest.hexdigest()}.pkl")
+
+    def saveScheduleCache(self, cachePath: str, schedule: pd.DataFrame) -> None:
+        try:
+            os.makedirs(self.scheduleCacheDirectory, exist_ok=True)
+            # Write to a temporary file first so a partial write is never loaded
+            schedule.to_pickle(f"{cachePath}.tmp")
+            os.replace(f"{cachePath}.tmp", cachePath)
+
+            # Only keep the most recently used reports
+            entries = sorted(
+                (
+                    os.path.join(self.scheduleCacheDirectory, name)
+                    for name in os.listdir(self.scheduleCacheDirectory)
+                    if name.endswith(".pkl")
+                ),
+                key=os.path.getmtime,
+                reverse=True,
+            )
+            for entry in entries[self.scheduleCacheEntries :]:
+                os.remove(entry)
+        except OSError as error:  # Caching is best effort, never fail the run
+            print(error)
+
+    def createOutputs(self, reportPath: str) -> int:
+        # Parse the report once and share it across all selected outputs
+        schedule = self.loadSchedule(reportPath)
 
         # Determine if the Destiny report does not have any classes
         if schedule.empty:
             return 0
-        # Report is not empty. Determine location and template to use
-        else:
-            location = self.centerReverse[schedule.iloc[0][4]]["name"]
-            template = self.centerReverse[schedule.iloc[0][4]]["template"]
-            if location == "SFC":
-                self.SFCClassroomSigns(schedule, location, template)
-            else:
-                self.GBCClassroomSigns(schedule, location, template)
+        # Sheets uploads run in the background while files are rendered. The
+        # run is only done once they have finished too. One pool of render
+        # workers serves every output, so worker start-up is paid once per run.
+        # renderWorkers of 0 uses one worker per CPU core and 1 renders in
+        # process.
+        workers = min(
+            self.renderWorkers or os.cpu_count() or 1, schedule["Date"].nunique()
+        )
+        if workers > 1:
+            self.renderPool = concurrent.futures.ProcessPoolExecutor(workers)
+        try:
+            if self.powerpointOutput:
+                self.startUploads(schedule)
+            if self.classroomSignsOutput:
+                self.createSignsFunction(schedule)
+            if self.dailyScheduleOutput:
+                self.createDailySchedule(schedule)
+            if self.powerpointOutput:
+                self.createPPT(schedule)
+        finally:
+            if self.renderPool is not None:
+                self.renderPool.shutdown()
+                self.renderPool = None
+            self.finishUploads()
         return 1
 
-    def GBCClassroomSigns(
-        self, schedule: pd.DataFrame, location: str, template: str
-    ) -> None:
-        # Determine the start and end date of the report
-        self.startDate = schedule.iloc[0][0].strftime("%Y-%m-%d")
-        self.endDate = schedule.iloc[-1][0].strftime("%Y-%m-%d")
-
-        # Sort the raw Destiny Report by Date -> Room # -> Start Time
-        schedule["Date"] = schedule["Date"].dt.strftime("%B %d, %Y")
-        sortedSchedule = schedule.sort_values(by=["Date", "Room", "Start Time"])
-        sortedSchedule["Start Time"] = sortedSchedule["Start Time"].dt.strftime(
-            "%I:%M %p"
-        )
-        sortedSchedule["End Time"] = sortedSchedule["End Time"].dt.strftime("%I:%M %p")
-
-        # Initialize variables for 'for loop', includes formating of the classroom signs
-        previousClassroom = ""
-        previousDate = ""
-        dayofweek = ""
-        doc = Document(template)
-        paragraph_format = doc.styles["Normal"].paragraph_format
-        paragraph_format.space_before = 0
-        paragraph_format.space_after = 0
-        paragraph_format.line_spacing = 1
-        font = doc.styles["Normal"].font
-        font.name = "Times New Roman"
-        font.bold = True
-        font.size = Pt(4)
+    def startUploads(self, schedule: pd.DataFrame) -> None:
+        # Upload the first day of the schedule for the lobby slides if setting
+        # and URL are set in config.ini file
+        location = self.centerReverse[schedule["Building"].iloc[0]]["name"]
+        if location == "SFC":
+            enabled = self.uploadSFCSchedule and self.SFCScheduleURL
+            upload = self.SFCScheduleToGSheets
+        else:
+            enabled = self.uploadGBCSchedule and self.GBCScheduleURL
+            upload = self.GBCScheduleToGSheets
+        if enabled:
+            date, day = next(Schedule.days(schedule, by=["Start Time", "Room"]))
+            self.uploads.append(
+                ScheduleSheets.pool.submit(upload, date, Section.fromSchedule(day))
+            )
 
-        # Set page orientation, page size, and margins
-        for section in doc.sections:
-            section.orientation = WD_ORIENT.LANDSCAPE  # Landscape
-            section.page_width = 10058400  # Page Width = 11 inches
-            section.page_height = 7772400  # Page Height = 8.5 inches
-            section.left_margin = 457200  # Left Margin = 0.5 inches
-            section.right_margin = 457200  # Right Margin = 0.5 inches
-            section.top_margin = 457200  # Top Margin = 0.5 inches
-            section.bottom_margin = 457200  # Bottom Margin = 0.5 inches
+    def finishUploads(self) -> None:
+        # Wait for the run's uploads and report the ones that failed
+        errors = []
+        for upload in self.uploads:
+            try:
+                error = upload.result()
+            except Exception as exception:
+                error = exception
+            if error is not None:
+                errors.append(error)
+        self.uploads = []
+        if errors:
+            QtWidgets.QMessageBox.warning(
+                None,
+                "Upload error",
+                "The schedule could not be uploaded to Google Sheets.\n"
+                + "\n".join(str(error) for error in errors),
+            )
 
-        # Add Title, Date, Classroom number, section title and start/end time
-        for index in range(0, len(sortedSchedule)):
-            newFile = False
-            if index != 0 and previousDate != sortedSchedule.iloc[index]["Date"]:
-                if index != 0 and index != len(sortedSchedule.index):
-                    newFile = True
-                    dayofweek = datetime.datetime.strptime(
-                        previousDate, "%B %d, %Y"
-                    ).strftime("%A")
-                    fileDate = datetime.datetime.strptime(
-                        previousDate, "%B %d, %Y"
-                    ).strftime("%Y-%m-%d")
-                    doc.save(
-                        f"{self.saveSignsDirectory}\\"
-                        f"{location} {fileDate} {dayofweek}.docx"
-                    )
-                    previousClassroom = ""
-                # Create Classroom Signs, set defaults for new file
-                doc = Document(template)
-                paragraph_format = doc.styles["Normal"].paragraph_format
-                paragraph_format.space_before = 0
-                paragraph_format.space_after = 0
-                paragraph_format.line_spacing = 1
-                font = doc.styles["Normal"].font
-                font.name = "Times New Roman"
-                font.bold = True
-                font.size = Pt(4)
-
-                # Set page orientation, page size, and margins
-                for section in doc.sections:
-                    section.orientation = WD_ORIENT.LANDSCAPE  # Landscape
-                    section.page_width = 10058400  # Page Width = 11 inches
-                    section.page_height = 7772400  # Page Height = 8.5 inches
-                    section.left_margin = 457200  # Left Margin = 0.5 inches
-                    section.right_margin = 457200  # Right Margin = 0.5 inches
-                    section.top_margin = 457200  # Top Margin = 0.5 inches
-                    section.bottom_margin = 457200  # Bottom Margin = 0.5 inches
-
-            if previousClassroom != sortedSchedule.iloc[index]["Room"]:
-                if index != 0 and index != len(sortedSchedule.index):
-                    if not newFile:
-                        doc.add_page_break()  # Reached end of page, start new page
-
-                para = doc.add_paragraph()
-                para.alignment = 1
-                run = para.add_run(
-                    sortedSchedule.iloc[index]["Date"].replace(" 0", " ")
-                )  # Date
-                run.font.size = Pt(48)
-
-                para = doc.add_paragraph()
-                para.alignment = 0
-                run = para.add_run(
-                    sortedSchedule.iloc[index]["Room"]
-                )  # Classroom Number
-                run.font.size = Pt(36)
-
-                para = doc.add_paragraph()
-                para.alignment = 0
-                run = para.add_run("Class:")  # Class
-                run.font.size = Pt(36)
-
-                run = para.add_run("\n")
-                run.font.size = Pt(2)
-
-                table = doc.add_table(rows=1, cols=2)  # Create table to put each course
-                table.alignment = 2
-                table.allow_autofit = False
-
-                row = table.rows[0]
-                row.cells[0].text = f"{sortedSchedule.iloc[index]['Section Title']}\n"
-                row.cells[1].text = (
-                    f"{sortedSchedule.iloc[index]['Start Time'].lstrip('0')} to "
-                    f"{sortedSchedule.iloc[index]['End Time'].lstrip('0')}"
-                )
-            else:
-                row = table.add_row()  # add a row if course is in same classroom
-                row.cells[0].text = f"{sortedSchedule.iloc[index]['Section Title']}\n"
-                row.cells[1].text = (
-                    f"{sortedSchedule.iloc[index]['Start Time'].lstrip('0')} to "
-                    f"{sortedSchedule.iloc[index]['End Time'].lstrip('0')}"
-                )
+    def createSignsFunction(self, schedule: pd.DataFrame) -> int:
+        # Determine if the Destiny report does not have any classes
+        if schedule.empty:
+            return 0
+        # Report is not empty. Determine location and template to use
+        else:
+            location = self.centerReverse[schedule["Building"].iloc[0]]["name"]
+            template = self.centerReverse[schedule["Building"].iloc[0]]["template"]
+            # Determine the start and end date of the report
+            self.startDate = Labels.isoDate(schedule["Date"].iloc[0])
+            self.endDate = Labels.isoDate(schedule["Date"].iloc[-1])
+            self.renderClassroomSigns(schedule, location, template)
+        return 1
 
-            previousClassroom = sortedSchedule.iloc[index]["Room"]
-            previousDate = sortedSchedule.iloc[index]["Date"]
-
-            # Format table columns
-            for cell in table.columns[0].cells:
-                cell.width = Inches(6.7)
-            for cell in table.columns[1].cells:
-                cell.width = Inches(3.3)
-            # Change font size of text in table
-            for row in table.rows:
-                for cell in row.cells:
-                    paragraphs = cell.paragraphs
-                    for paragraph in paragraphs:
-                        for run in paragraph.runs:
-                            font = run.font
-                            font.size = Pt(22)
-        # End for loop 'for index in range(0, len(sortedSchedule)):'
-
-        # Save as Microsoft Word docx file for each day
-        dayofweek = datetime.datetime.strptime(previousDate, "%B %d, %Y").strftime("%A")
-        fileDate = datetime.datetime.strptime(previousDate, "%B %d, %Y").strftime(
-            "%Y-%m-%d"
-        )
-        doc.save(f"{self.saveSignsDirectory}\\{location} {fileDate} {dayofweek}.docx")
-
-    def SFCClassroomSigns(
+    def renderClassroomSigns(
         self, schedule: pd.DataFrame, location: str, template: str
-    ) -> int:
-        # Determine the start and end date of the report
-        self.startDate = schedule.iloc[0][0].strftime("%Y-%m-%d")
-        self.endDate = schedule.iloc[-1][0].strftime("%Y-%m-%d")
-
-        # Sort the raw Destiny Report by Date -> Room # -> Start Time
-        schedule["Date"] = schedule["Date"].dt.strftime("%B %d, %Y")
-        sortedSchedule = schedule.sort_values(by=["Date", "Room", "Start Time"])
-        sortedSchedule["Start Time"] = sortedSchedule["Start Time"].dt.strftime(
-            "%I:%M %p"
-        )
-        sortedSchedule["End Time"] = sortedSchedule["End Time"].dt.strftime("%I:%M %p")
-
-        # Initialize variables for 'for loop', includes formating of the classroom signs
-        previousClassroom = ""
-        previousDate = ""
-        dayofweek = ""
-        doc = Document(template)
-        doc._body.clear_content()
-        paragraph_format = doc.styles["Normal"].paragraph_format
-        paragraph_format.space_before = 0
-        paragraph_format.space_after = Pt(10)
-        font = doc.styles["Normal"].font
-        font.name = "Arial"
-        font.bold = False
-        font.size = Pt(1)
-
-        # Set page orientation, page size, and margins
-        for section in doc.sections:
-            section.orientation = WD_ORIENT.PORTRAIT  # Landscape
-            section.page_width = 7772400  # Page Width = 11 inches
-            section.page_height = 10058400  # Page Height = 8.5 inches
-            section.left_margin = 457200  # Left Margin = 0.5 inches
-            section.right_margin = 457200  # Right Margin = 0.5 inches
-            section.top_margin = 457200  # Top Margin = 0.5 inches
-            section.bottom_margin = 457200  # Bottom Margin = 0.5 inches
-
-        # Add Title, Date, Classroom number, section title and start/end time
-        for index in range(0, len(sortedSchedule)):
-            newFile = False
-            if index != 0 and previousDate != sortedSchedule.iloc[index]["Date"]:
-                if index != 0 and index != len(sortedSchedule.index):
-                    newFile = True
-                    dayofweek = datetime.datetime.strptime(
-                        previousDate, "%B %d, %Y"
-                    ).strftime("%A")
-                    fileDate = datetime.datetime.strptime(
-                        previousDate, "%B %d, %Y"
-                    ).strftime("%Y-%m-%d")
-                    doc.save(
-                        f"{self.saveSignsDirectory}\\"
-                        f"{location} {fileDate} {dayofweek}.docx"
-                    )
-                    previousClassroom = ""
-                # Create Classroom Signs, set defaults for new file
-                doc = Document(template)
-                paragraph_format = doc.styles["Normal"].paragraph_format
-                paragraph_format.space_before = 0
-                paragraph_format.space_after = Pt(10)
-                font = doc.styles["Normal"].font
-                font.name = "Arial"
-                font.bold = False
-                font.size = Pt(1)
-
-                # Set page orientation, page size, and margins
-                for section in doc.sections:
-                    section.orientation = WD_ORIENT.PORTRAIT  # Landscape
-                    section.page_width = 7772400  # Page Width = 11 inches
-                    section.page_height = 10058400  # Page Height = 8.5 inches
-                    section.left_margin = 457200  # Left Margin = 0.5 inches
-                    section.right_margin = 457200  # Right Margin = 0.5 inches
-                    section.top_margin = 457200  # Top Margin = 0.5 inches
-                    section.bottom_margin = 457200  # Bottom Margin = 0.5 inches
-
-            if previousClassroom != sortedSchedule.iloc[index]["Room"]:
-                if index != 0 and index != len(sortedSchedule.index):
-                    if not newFile:
-                        doc.add_page_break()  # Reached end of page, start new page
-
-                para = doc.add_paragraph()
-                para.alignment = 1
-                run = para.add_run(
-                    datetime.datetime.strptime(
-                        sortedSchedule.iloc[index]["Date"], "%B %d, %Y"
-                    ).strftime("%A")
-                )  # Date
-                run.font.size = Pt(30)
-                # run.underline = True
-                run.bold = True
-
-                para = doc.add_paragraph()
-                para.alignment = 1
-                run = para.add_run(
-                    sortedSchedule.iloc[index]["Room"].replace("Classroom", "Room")
-                )  # Classroom Number
-                run.font.size = Pt(24)
-
-                run = para.add_run("\n")
-                run.font.size = Pt(34)
-
-                table = doc.add_table(rows=1, cols=2)  # Create table to put each course
-                table.alignment = 2
-                table.allow_autofit = False
-
-                row = table.rows[0]
-                row.cells[0].text = "Course"
-                row.cells[0].paragraphs[0].runs[0].font.underline = True
-                row.cells[0].paragraphs[0].runs[0].font.bold = True
-                row.cells[0].paragraphs[0].runs[0].font.size = Pt(22)
-                row.cells[1].text = "Time"
-                row.cells[1].paragraphs[0].runs[0].font.underline = True
-                row.cells[1].paragraphs[0].runs[0].font.bold = True
-                row.cells[1].paragraphs[0].runs[0].font.size = Pt(22)
-
-                row = table.add_row()
-                row.cells[0].text = f"{sortedSchedule.iloc[index]['Section Title']}\n"
-                row.cells[1].text = (
-                    f"{sortedSchedule.iloc[index]['Start Time'].lstrip('0')} - "
-                    f"{sortedSchedule.iloc[index]['End Time'].lstrip('0')}"
-                )
+    ) -> list[str]:
+        # Sort by Date -> Room # -> Start Time and build one job per day. The
+        # workers get the day's sections grouped by room, not a DataFrame.
+        jobs = [
+            (
+                location,
+                template,
+                f"{self.saveSignsDirectory}\\{location} "
+                f"{Labels.isoDate(date)} {Labels.weekday(date)}.docx",
+                date,
+                RoomDay.group(day),
+            )
+            for date, day in Section.days(schedule, by=["Room", "Start Time"])
+        ]
 
-                row.cells[0].paragraphs[0].runs[0].font.size = Pt(22)
-                row.cells[1].paragraphs[0].runs[0].font.size = Pt(22)
-            else:
-                row = table.add_row()  # add a row if course is in same classroom
-                row.cells[0].text = f"{sortedSchedule.iloc[index]['Section Title']}\n"
-                row.cells[1].text = (
-                    f"{sortedSchedule.iloc[index]['Start Time'].lstrip('0')} - "
-                    f"{sortedSchedule.iloc[index]['End Time'].lstrip('0')}"
-                )
-                row.cells[0].paragraphs[0].runs[0].font.size = Pt(22)
-                row.cells[1].paragraphs[0].runs[0].font.size = Pt(22)
+        # signBackend "docx" builds signs through python-docx instead of xml
+        if self.signBackend == "docx":
+            renderDay = ClassroomSigns.docxDay
+        else:
+            renderDay = ClassroomSigns.xmlDay
 
-            previousClassroom = sortedSchedule.iloc[index]["Room"]
-            previousDate = sortedSchedule.iloc[index]["Date"]
+        return self.renderDays(jobs, renderDay)
 
-            # Format table columns
-            for cell in table.columns[0].cells:
-                cell.width = Inches(5)
-            for cell in table.columns[1].cells:
-                cell.width = Inches(3.3)
-
-        # Save as Microsoft Word docx file for each day
-        dayofweek = datetime.datetime.strptime(previousDate, "%B %d, %Y").strftime("%A")
-        fileDate = datetime.datetime.strptime(previousDate, "%B %d, %Y").strftime(
-            "%Y-%m-%d"
-        )
-        doc.save(f"{self.saveSignsDirectory}\\{location} {fileDate} {dayofweek}.docx")
-        return 1
-
-    def createDailySchedule(self, reportPath: str) -> int:
-        # Read in courses from Excel
-        # 1     B   Date
-        # 3     D   Type
-        # 4     E   Start Time
-        # 6     G   End Time
-        # 9     J   Section Number
-        # 11    L   Section Title
-        # 12    M   Instructor
-        # 13    N   Building
-        # 15    P   Room
-        # 16    Q   Configuration
-        # 17    R   Technology
-        # 18    S   Section Size
-        # 20    U   Notes
-        # 22    W   Approval Status
-
-        # Read into Pandas dataframe for relevant columns
-        schedule = pd.read_excel(
-            reportPath,
-            header=6,
-            skipfooter=1,
-            usecols=[1, 4, 6, 9, 11, 12, 13, 15, 22],
-            parse_dates=[1, "Start Time", "End Time"],
-            date_format={
-                "Date": "%Y/%m/%d %H:%M:%S",
-                "Start Time": "%I:%M%p",
-                "End Time": "%I:%M%p",
-            },
-        )
-        schedule = schedule[schedule["Approval Status"] == "Final Approval"].copy()
+    def renderDays(self, jobs: list[tuple], renderDay: Callable) -> list:
+        # Days are independent, so each job runs on the run's render pool, if
+        # there is one. Workers read each template once and keep it for later
+        # jobs. Results come back in job order.
+        if self.renderPool is None or len(jobs) <= 1:
+            return [renderDay(*job) for job in jobs]
+        return list(self.renderPool.map(renderDay, *zip(*jobs)))
 
+    def createDailySchedule(self, schedule: pd.DataFrame) -> int:
         # Determine if the Destiny report does not have any classes
         if schedule.empty:
             return 0
         # Report is not empty. Determine location and template to use
         else:
-            location = self.centerReverse[schedule.iloc[0][6]]["name"]
-            if location == "SFC":
-                self.SFCDailySchedule(schedule, location)
-            else:
-                self.GBCDailySchedule(schedule, location)
+            location = self.centerReverse[schedule["Building"].iloc[0]]["name"]
+            # Sort once and split into per-day lists of section records
+            days = Section.days(schedule, by=["Start Time", "Room"])
+            self.writeDailySchedules(location, days)
         return 1
 
-    def GBCDailySchedule(self, schedule: pd.DataFrame, location: str) -> int:
-        sortedSchedule = schedule.sort_values(by=["Date", "Start Time", "Room"])
-        sortedSchedule = sortedSchedule.fillna("")
-        dateList = sortedSchedule["Date"].dt.date.unique()
-
-        if len(dateList) == 1:
-            writer = pd.ExcelWriter(
-                (
-                    f"{self.saveSignsDirectory}\\{location} "
-                    f"{dateList[0].strftime('%Y-%m-%d')} "
-                    f"{dateList[0].strftime('%A')}.xlsx"
-                ),
-                engine="xlsxwriter",
-            )
-        else:
-            writer = pd.ExcelWriter(
-                (
-                    f"{self.saveSignsDirectory}\\{location} "
-                    f"{dateList[0].strftime('%Y-%m-%d')} "
-                    f"{dateList[0].strftime('%A')} to "
-                    f"{dateList[-1].strftime('%Y-%m-%d')} "
-                    f"{dateList[-1].strftime('%A')}.xlsx"
-                ),
-                engine="xlsxwriter",
-            )
-        workbook = writer.book
-        # Loop through each day
-        for i in range(0, len(dateList)):
-            worksheet = workbook.add_worksheet(dateList[i].strftime("%Y-%m-%d"))
-            worksheet.set_landscape()  # Page orientation as landscape.
-            worksheet.hide_gridlines(0)  # Don’t hide gridlines.
-            worksheet.fit_to_pages(1, 1)  # Fit to 1x1 pages.
-            worksheet.center_horizontally()
-            worksheet.center_vertically()
-            worksheet.set_paper(1)  # Set paper size to 8.5" x 11"
-            worksheet.set_margins(left=0.25, right=0.25, top=0.25, bottom=0.25)
-            worksheet.set_header("", {"margin": 0})
-            worksheet.set_footer("", {"margin": 0})
-
-            worksheet.set_column("A:A", 21.5)  # Column A (Start Time) width set to 23.
-            worksheet.set_column("B:B", 19)  # Column B (End Time) width set to 19.
-            worksheet.set_column("D:D", 64)  # Column D (Section Title) width set to 64.
-
-            titleFormat = workbook.add_format(
-                {
-                    "font_name": "Verdana",
-                    "font_size": 18,
-                    "bold": True,
-                    "text_wrap": False,
-                    "font_color": "#000000",
-                }
-            )
-
-            headerFormat = workbook.add_format(
-                {
-                    "font_name": "Verdana",
-                    "font_size": 18,
-                    "bold": True,
-                    "text_wrap": True,
-                    "bottom": 2,
-                    "bottom_color": "#000000",
-                }
-            )
-
-            bodyFormat = workbook.add_format(
-                {
-                    "font_name": "Verdana",
-                    "font_size": 18,
-                    "bold": False,
-                    "valign": "top",
-                    "text_wrap": True,
-                    "font_color": "#000000",
-                }
-            )
-
-            worksheet.write(0, 0, "UC Berkeley Extension", titleFormat)
-            worksheet.write(
-                0,
-                4,
-                (
-                    f"{dateList[i].strftime('%A')} "
-                    f"{dateList[i].strftime('%B %d, %Y').replace(' 0', ' ')}"
-                ),
-                titleFormat,
-            )
-            for col_num, value in enumerate(
+    def writeDailySchedules(
+        self, location: str, days: list[tuple[pd.Timestamp, list[Section]]]
+    ) -> None:
+        # dailyScheduleMode "days" writes each day to its own workbook in the
+        # worker pool. Otherwise every day is a sheet of one workbook, which
+        # "streaming" writes row by row in xlsxwriter's constant memory mode.
+        if self.dailyScheduleMode == "days":
+            self.renderDays(
                 [
-                    "Start Time",
-                    "End Time",
-                    "Section Number",
-                    "Section Title",
-                    "Instructor",
-                    "Room",
-                ]
-            ):
-                worksheet.write(2, col_num, value, headerFormat)
-
-            singleDaySched = sortedSchedule.loc[
-                sortedSchedule["Date"].dt.date == dateList[i], :
-            ]
-
-            morningBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("00:00", "12:00", inclusive="left")
-                .reset_index()
-            )
-            afternoonBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("12:00", "17:00", inclusive="left")
-                .reset_index()
-            )
-            eveningBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("17:00", "00:00", inclusive="left")
-                .reset_index()
-            )
-
-            morningBlock["Start Time"] = morningBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            morningBlock["End Time"] = morningBlock["End Time"].dt.strftime("%I:%M %p")
-            afternoonBlock["Start Time"] = afternoonBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            afternoonBlock["End Time"] = afternoonBlock["End Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            eveningBlock["Start Time"] = eveningBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            eveningBlock["End Time"] = eveningBlock["End Time"].dt.strftime("%I:%M %p")
-
-            excelRow = 3
-            if not morningBlock.empty:
-                worksheet.write(excelRow, 0, "Morning Classes", titleFormat)
-                excelRow += 1
-                for i, row in morningBlock.iterrows():
-                    worksheet.write(
-                        excelRow, 0, row["Start Time"].lstrip("0"), bodyFormat
-                    )
-                    worksheet.write(
-                        excelRow, 1, row["End Time"].lstrip("0"), bodyFormat
-                    )
-                    worksheet.write(excelRow, 2, row["Section Number"], bodyFormat)
-                    worksheet.write(excelRow, 3, row["Section Title"], bodyFormat)
-                    if row["Instructor"] == "Instructor To Be Announced":
-                        worksheet.write(excelRow, 4, "TBA", bodyFormat)
-                    elif not pd.isnull(row["Instructor"]):
-                        worksheet.write(excelRow, 4, row["Instructor"], bodyFormat)
-                    worksheet.write(excelRow, 5, row["Room"], bodyFormat)
-                    excelRow += 1
-
-            if not afternoonBlock.empty:
-                excelRow += 1
-                worksheet.write(excelRow, 0, "Afternoon Classes", titleFormat)
-                excelRow += 1
-                for i, row in afternoonBlock.iterrows():
-                    worksheet.write(
-                        excelRow, 0, row["Start Time"].lstrip("0"), bodyFormat
-                    )
-                    worksheet.write(
-                        excelRow, 1, row["End Time"].lstrip("0"), bodyFormat
-                    )
-                    worksheet.write(excelRow, 2, row["Section Number"], bodyFormat)
-                    worksheet.write(excelRow, 3, row["Section Title"], bodyFormat)
-                    if row["Instructor"] == "Instructor To Be Announced":
-                        worksheet.write(excelRow, 4, "TBA", bodyFormat)
-                    elif not pd.isnull(row["Instructor"]):
-                        worksheet.write(excelRow, 4, row["Instructor"], bodyFormat)
-                    worksheet.write(excelRow, 5, row["Room"], bodyFormat)
-                    excelRow += 1
-
-            if not eveningBlock.empty:
-                excelRow += 1
-                worksheet.write(excelRow, 0, "Evening Classes", titleFormat)
-                excelRow += 1
-                for i, row in eveningBlock.iterrows():
-                    worksheet.write(
-                        excelRow, 0, row["Start Time"].lstrip("0"), bodyFormat
-                    )
-                    worksheet.write(
-                        excelRow, 1, row["End Time"].lstrip("0"), bodyFormat
+                    (
+                        location,
+                        f"{self.saveSignsDirectory}\\{location} "
+                        f"{Labels.isoDate(date)} {Labels.weekday(date)}.xlsx",
+                        date,
+                        day,
                     )
-                    worksheet.write(excelRow, 2, row["Section Number"], bodyFormat)
-                    worksheet.write(excelRow, 3, row["Section Title"], bodyFormat)
-                    if row["Instructor"] == "Instructor To Be Announced":
-                        worksheet.write(excelRow, 4, "TBA", bodyFormat)
-                    elif not pd.isnull(row["Instructor"]):
-                        worksheet.write(excelRow, 4, row["Instructor"], bodyFormat)
-                    worksheet.write(excelRow, 5, row["Room"], bodyFormat)
-                    excelRow += 1
-
-            # Set the minimum column width of ['Section Number', 'Instructor', 'Room']
-            max_length = [
-                14,
-                10,
-                4,
-            ]
-            for i, row in singleDaySched.iterrows():
-                try:  # Necessary to avoid error on empty cells
-                    if len(str(row["Section Number"])) > max_length[0]:
-                        max_length[0] = len(row["Section Number"])
-                    if (
-                        (row["Instructor"] != "Instructor To Be Announced")
-                        and (len(str(row["Instructor"])) > max_length[1])
-                        and (len(str(row["Instructor"])) <= 20)
-                    ):
-                        max_length[1] = len(row["Instructor"])
-                    if len(str(row["Room"])) > max_length[2]:
-                        max_length[2] = len(row["Room"])
-                except Exception:
-                    pass
-
-            # Auto fit columns based on character count.
-            worksheet.set_column("C:C", (max_length[0] + 1) * (40 / 19))
-            worksheet.set_column("E:E", (max_length[1] + (8 / 9)) * (27 / 14))
-            worksheet.set_column("F:F", (max_length[2] - (7 / 13)) * (13 / 6))
-
-        workbook.close()
-        return 1
-
-    def SFCDailySchedule(self, schedule: pd.DataFrame, location: str) -> int:
-        sortedSchedule = schedule.sort_values(by=["Date", "Start Time", "Room"])
-        sortedSchedule = sortedSchedule.fillna("")
-        dateList = sortedSchedule["Date"].dt.date.unique()
+                    for date, day in days
+                ],
+                DailySchedules.writeDay,
+            )
+            return
 
-        if len(dateList) == 1:
-            writer = pd.ExcelWriter(
-                (
-                    f"{self.saveSignsDirectory}\\{location} "
-                    f"{dateList[0].strftime('%Y-%m-%d')} "
-                    f"{dateList[0].strftime('%A')}.xlsx"
-                ),
-                engine="xlsxwriter",
+        if len(days) == 1:
+            path = (
+                f"{self.saveSignsDirectory}\\{location} "
+                f"{Labels.isoDate(days[0][0])} "
+                f"{Labels.weekday(days[0][0])}.xlsx"
             )
         else:
-            writer = pd.ExcelWriter(
-                (
-                    f"{self.saveSignsDirectory}\\{location} "
-                    f"{dateList[0].strftime('%Y-%m-%d')} "
-                    f"{dateList[0].strftime('%A')} to "
-                    f"{dateList[-1].strftime('%Y-%m-%d')} "
-                    f"{dateList[-1].strftime('%A')}.xlsx"
-                ),
-                engine="xlsxwriter",
+            path = (
+                f"{self.saveSignsDirectory}\\{location} "
+                f"{Labels.isoDate(days[0][0])} "
+                f"{Labels.weekday(days[0][0])} to "
+                f"{Labels.isoDate(days[-1][0])} "
+                f"{Labels.weekday(days[-1][0])}.xlsx"
             )
+        writer = pd.ExcelWriter(
+            path,
+            engine="xlsxwriter",
+            engine_kwargs={
+                "options": {"constant_memory": self.dailyScheduleMode == "streaming"}
+            },
+        )
         workbook = writer.book
+        formats = DailySchedules.formats(location, workbook)
         # Loop through each day
-        for i in range(0, len(dateList)):
-            worksheet = workbook.add_worksheet(dateList[i].strftime("%Y-%m-%d"))
-            worksheet.set_portrait()  # Page orientation as landscape.
-            # worksheet.hide_gridlines(0)     # Don’t hide gridlines.
-            worksheet.fit_to_pages(1, 1)  # Fit to 1x1 pages.
-            worksheet.center_horizontally()
-            worksheet.center_vertically()
-            worksheet.set_paper(1)  # Set paper size to 8.5" x 11"
-            worksheet.set_margins(left=0.25, right=0.25, top=0.25, bottom=0.25)
-            worksheet.set_header("", {"margin": 0})
-            worksheet.set_footer("", {"margin": 0})
-
-            worksheet.set_column("A:A", 21.5)  # Column A (Start Time) width set to 23.
-            worksheet.set_column("B:B", 19)  # Column B (End Time) width set to 19.
-            worksheet.set_column("D:D", 64)  # Column D (Section Title) width set to 64.
-
-            titleFormat = workbook.add_format(
-                {
-                    "font_name": "Arial",
-                    "font_size": 30,
-                    "align": "center",
-                    "bold": True,
-                    "text_wrap": False,
-                    "font_color": "red",
-                    "underline": True,
-                }
-            )
-
-            blankFormat = workbook.add_format(
-                {
-                    "font_name": "Arial",
-                    "font_size": 8,
-                }
-            )
-
-            headerFormat = workbook.add_format(
-                {
-                    "font_name": "Arial",
-                    "font_size": 24,
-                    "bold": True,
-                    "text_wrap": True,
-                    "underline": True,
-                }
-            )
-
-            blockFormat = workbook.add_format(
-                {
-                    "font_name": "Arial",
-                    "font_size": 24,
-                    "bold": True,
-                    "text_wrap": False,
-                    "align": "left",
-                    "valign": "top",
-                    "underline": True,
-                }
-            )
-
-            bodyFormat = workbook.add_format(
-                {
-                    "font_name": "Arial",
-                    "font_size": 21,
-                    "bold": False,
-                    "valign": "top",
-                    "text_wrap": True,
-                    "font_color": "#000000",
-                }
-            )
-
-            # Title and header rows
-            worksheet.merge_range(
-                "A1:E1",
-                (
-                    f"UC Berkeley Extension - {dateList[i].strftime('%A')}, "
-                    f"{dateList[i].strftime('%B %d, %Y').replace(' 0', ' ')}"
-                ),
-                titleFormat,
-            )
-            for col_num, value in enumerate(
-                ["Start Time", "End Time", "Section Number", "Section Title", "Room"]
-            ):
-                worksheet.write(1, col_num, value, headerFormat)
-
-            # Filter by daytime and evening, then by floor
-            singleDaySched = sortedSchedule.loc[
-                sortedSchedule["Date"].dt.date == dateList[i], :
-            ]
-            daytimeBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("00:00", "17:00", inclusive="left")
-                .reset_index()
-            )
-            daytimeBlock = daytimeBlock.sort_values(by=["Room", "Start Time"])
-            daytimeBlock["Start Time"] = daytimeBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            daytimeBlock["End Time"] = daytimeBlock["End Time"].dt.strftime("%I:%M %p")
-            daytime5thFlr = daytimeBlock.loc[daytimeBlock["Room"] <= "Classroom 515", :]
-            daytime6thFlr = daytimeBlock.loc[
-                (daytimeBlock["Room"] >= "Classroom 602")
-                & (daytimeBlock["Room"] <= "Classroom 613"),
-                :,
-            ]
-            daytime7thFlr = daytimeBlock.loc[daytimeBlock["Room"] >= "Classroom 702", :]
-
-            eveningBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("17:00", "00:00", inclusive="left")
-                .reset_index()
-            )
-            eveningBlock["Start Time"] = eveningBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            eveningBlock["End Time"] = eveningBlock["End Time"].dt.strftime("%I:%M %p")
-            eveningBlock = eveningBlock.sort_values(by=["Room", "Start Time"])
-            evening5thFlr = eveningBlock.loc[eveningBlock["Room"] <= "Classroom 515", :]
-            evening6thFlr = eveningBlock.loc[
-                (eveningBlock["Room"] >= "Classroom 602")
-                & (eveningBlock["Room"] <= "Classroom 613"),
-                :,
-            ]
-            evening7thFlr = eveningBlock.loc[eveningBlock["Room"] >= "Classroom 702", :]
-
-            # Write to cells starting with daytime courses, by floor
-            excelRow = 2
-            worksheet.merge_range(
-                f"A{str(excelRow+1)}:E{str(excelRow +1)}", "", blankFormat
-            )
-            if not daytimeBlock.empty:
-                excelRow += 1
-                worksheet.merge_range(
-                    f"A{str(excelRow + 1)}:B{str(excelRow + 2)}",
-                    "Daytime Classes",
-                    blockFormat,
-                )
-                worksheet.merge_range(
-                    f"C{str(excelRow + 1)}:E{str(excelRow + 2)}", "", blockFormat
-                )
-                excelRow += 1
-
-                if not daytime5thFlr.empty:
-                    excelRow += 1
-                    worksheet.merge_range(
-                        f"A{str(excelRow+1)}:B{str(excelRow +1)}",
-                        "5th Floor",
-                        blockFormat,
-                    )
-                    worksheet.merge_range(
-                        f"C{str(excelRow + 1)}:E{str(excelRow + 1)}", "", blockFormat
-                    )
-                    excelRow += 1
-
-                    for i, row in daytime5thFlr.iterrows():
-                        worksheet.write(
-                            excelRow, 0, row["Start Time"].lstrip("0"), bodyFormat
-                        )
-                        worksheet.write(
-                            excelRow, 1, row["End Time"].lstrip("0"), bodyFormat
-                        )
-                        worksheet.write(excelRow, 2, row["Section Number"], bodyFormat)
-                        worksheet.write(excelRow, 3, row["Section Title"], bodyFormat)
-                        worksheet.write(
-                            excelRow,
-                            4,
-                            row["Room"].replace("Classroom", ""),
-                            bodyFormat,
-                        )
-                        excelRow += 1
-                    worksheet.merge_range(
-                        f"A{str(excelRow+1)}:E{str(excelRow +1)}", "", blankFormat
-                    )
-
-                if not daytime6thFlr.empty:
-                    excelRow += 1
-                    worksheet.merge_range(
-                        f"A{str(excelRow+1)}:B{str(excelRow +1)}",
-                        "6th Floor",
-                        blockFormat,
-                    )
-                    worksheet.merge_range(
-                        f"C{str(excelRow + 1)}:E{str(excelRow + 1)}", "", blockFormat
-                    )
-                    excelRow += 1
-
-                    for i, row in daytime6thFlr.iterrows():
-                        worksheet.write(
-                            excelRow, 0, row["Start Time"].lstrip("0"), bodyFormat
-                        )
-                        worksheet.write(
-                            excelRow, 1, row["End Time"].lstrip("0"), bodyFormat
-                        )
-                        worksheet.write(excelRow, 2, row["Section Number"], bodyFormat)
-                        worksheet.write(excelRow, 3, row["Section Title"], bodyFormat)
-                        worksheet.write(
-                            excelRow,
-                            4,
-                            row["Room"].replace("Classroom", ""),
-                            bodyFormat,
-                        )
-                        excelRow += 1
-                    worksheet.merge_range(
-                        f"A{str(excelRow+1)}:E{str(excelRow +1)}", "", blankFormat
-                    )
-
-                if not daytime7thFlr.empty:
-                    excelRow += 1
-                    worksheet.merge_range(
-                        f"A{str(excelRow+1)}:B{str(excelRow +1)}",
-                        "7th Floor",
-                        blockFormat,
-                    )
-                    worksheet.merge_range(
-                        f"C{str(excelRow + 1)}:E{str(excelRow + 1)}", "", blockFormat
-                    )
-                    excelRow += 1
-
-                    for i, row in daytime7thFlr.iterrows():
-                        worksheet.write(
-                            excelRow, 0, row["Start Time"].lstrip("0"), bodyFormat
-                        )
-                        worksheet.write(
-                            excelRow, 1, row["End Time"].lstrip("0"), bodyFormat
-                        )
-                        worksheet.write(excelRow, 2, row["Section Number"], bodyFormat)
-                        worksheet.write(excelRow, 3, row["Section Title"], bodyFormat)
-                        worksheet.write(
-                            excelRow,
-                            4,
-                            row["Room"].replace("Classroom", ""),
-                            bodyFormat,
-                        )
-                        excelRow += 1
-                    worksheet.merge_range(
-                        f"A{str(excelRow+1)}:E{str(excelRow +1)}", "", blankFormat
-                    )
-
-            # Write to cells for evening courses, by floor
-            if not eveningBlock.empty:
-                excelRow += 1
-                worksheet.merge_range(
-                    f"A{str(excelRow+1)}:B{str(excelRow + 2)}",
-                    "Evening Classes",
-                    blockFormat,
-                )
-                worksheet.merge_range(
-                    f"C{str(excelRow + 1)}:E{str(excelRow + 2)}", "", blockFormat
-                )
-                excelRow += 1
-
-                if not evening5thFlr.empty:
-                    excelRow += 1
-                    worksheet.merge_range(
-                        f"A{str(excelRow+1)}:B{str(excelRow +1)}",
-                        "5th Floor",
-                        blockFormat,
-                    )
-                    worksheet.merge_range(
-                        f"C{str(excelRow + 1)}:E{str(excelRow + 1)}", "", blockFormat
-                    )
-                    excelRow += 1
-
-                    for i, row in evening5thFlr.iterrows():
-                        worksheet.write(
-                            excelRow, 0, row["Start Time"].lstrip("0"), bodyFormat
-                        )
-                        worksheet.write(
-                            excelRow, 1, row["End Time"].lstrip("0"), bodyFormat
-                        )
-                        worksheet.write(excelRow, 2, row["Section Number"], bodyFormat)
-                        worksheet.write(excelRow, 3, row["Section Title"], bodyFormat)
-                        worksheet.write(
-                            excelRow,
-                            4,
-                            row["Room"].replace("Classroom", ""),
-                            bodyFormat,
-                        )
-                        excelRow += 1
-                    worksheet.merge_range(
-                        f"A{str(excelRow+1)}:E{str(excelRow +1)}", "", blankFormat
-                    )
-
-                if not evening6thFlr.empty:
-                    excelRow += 1
-                    worksheet.merge_range(
-                        f"A{str(excelRow+1)}:B{str(excelRow +1)}",
-                        "6th Floor",
-                        blockFormat,
-                    )
-                    worksheet.merge_range(
-                        f"C{str(excelRow + 1)}:E{str(excelRow + 1)}", "", blockFormat
-                    )
-                    excelRow += 1
-
-                    for i, row in evening6thFlr.iterrows():
-                        worksheet.write(
-                            excelRow, 0, row["Start Time"].lstrip("0"), bodyFormat
-                        )
-                        worksheet.write(
-                            excelRow, 1, row["End Time"].lstrip("0"), bodyFormat
-                        )
-                        worksheet.write(excelRow, 2, row["Section Number"], bodyFormat)
-                        worksheet.write(excelRow, 3, row["Section Title"], bodyFormat)
-                        worksheet.write(
-                            excelRow,
-                            4,
-                            row["Room"].replace("Classroom", ""),
-                            bodyFormat,
-                        )
-                        excelRow += 1
-                    worksheet.merge_range(
-                        f"A{str(excelRow+1)}:E{str(excelRow +1)}", "", blankFormat
-                    )
-
-                if not evening7thFlr.empty:
-                    excelRow += 1
-                    worksheet.merge_range(
-                        f"A{str(excelRow+1)}:B{str(excelRow +1)}",
-                        "7th Floor",
-                        blockFormat,
-                    )
-                    worksheet.merge_range(
-                        f"C{str(excelRow + 1)}:E{str(excelRow + 1)}", "", blockFormat
-                    )
-                    excelRow += 1
-
-                    for i, row in evening7thFlr.iterrows():
-                        worksheet.write(
-                            excelRow, 0, row["Start Time"].lstrip("0"), bodyFormat
-                        )
-                        worksheet.write(
-                            excelRow, 1, row["End Time"].lstrip("0"), bodyFormat
-                        )
-                        worksheet.write(excelRow, 2, row["Section Number"], bodyFormat)
-                        worksheet.write(excelRow, 3, row["Section Title"], bodyFormat)
-                        worksheet.write(
-                            excelRow,
-                            4,
-                            row["Room"].replace("Classroom", ""),
-                            bodyFormat,
-                        )
-                        excelRow += 1
-
-            # Adjust column with of the excel file
-            worksheet.set_column("A:A", 18.57)
-            worksheet.set_column("B:B", 18.57)
-            worksheet.set_column("C:C", 43)
-            worksheet.set_column("D:D", 100)
-            worksheet.set_column("E:E", 13.86)
-
+        for date, day in days:
+            DailySchedules.sheet(location, workbook, formats, date, day)
         workbook.close()
-        return 1
-
-    def createPPT(self, reportPath: str) -> int:
-        # Read in courses from Excel
-        # 1     B   Date
-        # 3     D   Type
-        # 4     E   Start Time
-        # 6     G   End Time
-        # 9     J   Section Number
-        # 11    L   Section Title
-        # 12    M   Instructor
-        # 13    N   Building
-        # 15    P   Room
-        # 16    Q   Configuration
-        # 17    R   Technology
-        # 18    S   Section Size
-        # 20    U   Notes
-        # 22    W   Approval Status
-
-        # Read into Pandas dataframe for relevant columns
-        schedule = pd.read_excel(
-            reportPath,
-            header=6,
-            skipfooter=1,
-            usecols=[1, 4, 6, 9, 11, 12, 13, 15, 22],
-            parse_dates=[1, "Start Time", "End Time"],
-            date_format={
-                "Date": "%Y/%m/%d %H:%M:%S",
-                "Start Time": "%I:%M%p",
-                "End Time": "%I:%M%p",
-            },
-        )
-        schedule = schedule[schedule["Approval Status"] == "Final Approval"].copy()
 
+    def createPPT(self, schedule: pd.DataFrame) -> int:
         # Determine if the Destiny report does not have any classes
         if schedule.empty:
             return 0
         # Report is not empty. Determine location and which template to use
         else:
-            location = self.centerReverse[schedule.iloc[0][6]]["name"]
-            template = self.centerReverse[schedule.iloc[0][6]]["pptTemplate"]
+            location = self.centerReverse[schedule["Building"].iloc[0]]["name"]
+            template = self.centerReverse[schedule["Building"].iloc[0]]["pptTemplate"]
             if location == "SFC":
                 self.SFCppt(schedule, location, template)
             else:
@@ -2121,882 +2899,103 @@ class Ui_mainWindow(object):
         return 1
 
     def GBCppt(self, schedule: pd.DataFrame, location: str, template: str) -> int:
-        # Sort the schedule
-        sortedSchedule = schedule.sort_values(by=["Date", "Start Time", "Room"])
-        sortedSchedule = sortedSchedule.fillna("")
-        dateList = sortedSchedule["Date"].dt.date.unique()
-
-        # Upload GBC schedule if setting and URL are set in config.ini file
-        if self.uploadGBCSchedule and self.GBCScheduleURL:
-            self.GBCScheduleToGSheets(
-                dateList[0],
-                sortedSchedule.loc[sortedSchedule["Date"].dt.date == dateList[0], :],
-            )
+        # Sort once and split into per-day lists of section records
+        days = Section.days(schedule, by=["Start Time", "Room"])
 
         # Write out schedule one block per slide. Hide slide if no classes.
-        for i in range(0, len(dateList)):
-            singleDaySched = sortedSchedule.loc[
-                sortedSchedule["Date"].dt.date == dateList[i], :
-            ]
-
-            morningBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("00:00", "12:00", inclusive="left")
-                .reset_index()
-            )
-            afternoonBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("12:00", "17:00", inclusive="left")
-                .reset_index()
-            )
-            eveningBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("17:00", "00:00", inclusive="left")
-                .reset_index()
-            )
-
-            morningBlock["Start Time"] = morningBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            morningBlock["End Time"] = morningBlock["End Time"].dt.strftime("%I:%M %p")
-            afternoonBlock["Start Time"] = afternoonBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            afternoonBlock["End Time"] = afternoonBlock["End Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            eveningBlock["Start Time"] = eveningBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            eveningBlock["End Time"] = eveningBlock["End Time"].dt.strftime("%I:%M %p")
-
-            prs = Presentation(template)
-
-            slide = prs.slides[1]
-            if not morningBlock.empty:
-                text_frame = slide.shapes[2].text_frame
-                text_frame.clear()
-                p = text_frame.paragraphs[0]
-                run = p.add_run()
-                run.text = (
-                    f"UC Berkeley Extension {dateList[i].strftime('%A')}, "
-                    f"{dateList[i].strftime('%B %d, %Y').replace(' 0', ' ')}"
-                )
-                font = run.font
-                font.size = Pt(120)
-                font.name = "Calibri"
-                font.bold = True
-                font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-                table = slide.shapes[0].table
-
-                currentRow = 1
-                colorToggle = True
-                for idx, row in morningBlock.iterrows():
-                    if colorToggle:
-                        color = RGBColor(0xFF, 0xFF, 0xFF)
-                    else:
-                        color = RGBColor(0xFA, 0xC0, 0x90)
-                    colorToggle = not colorToggle
-                    for col, value in enumerate(
-                        [
-                            "Start Time",
-                            "End Time",
-                            "Section Title",
-                            "Instructor",
-                            "Room",
-                        ]
-                    ):
-                        text_frame = table.rows[currentRow].cells[col].text_frame
-                        p = text_frame.paragraphs[0]
-                        run = p.add_run()
-                        if (value == "Instructor") and (
-                            (row["Instructor"] == "Instructor To Be Announced")
-                            or (pd.isnull(row["Instructor"]))
-                        ):
-                            run.text = "TBA"
-                        else:
-                            run.text = str(row[value]).lstrip("0")
-                        font = run.font
-                        fontSize = (
-                            65
-                            if 950 // len(morningBlock.index) >= 65
-                            else 950 // len(morningBlock.index)
-                        )
-                        font.size = Pt(fontSize)
-                        font.name = "Calibri"
-                        font.bold = True
-                        font.color.rgb = color
-                    currentRow += 1
-            else:
-                slide._element.set("show", "0")
-
-            slide = prs.slides[2]
-            if not afternoonBlock.empty:
-                text_frame = slide.shapes[2].text_frame
-                text_frame.clear()
-                p = text_frame.paragraphs[0]
-                run = p.add_run()
-                run.text = (
-                    f"UC Berkeley Extension {dateList[i].strftime('%A')} "
-                    f"{dateList[i].strftime('%B %d, %Y').replace(' 0', ' ')}"
-                )
-                font = run.font
-                font.size = Pt(120)
-                font.name = "Calibri"
-                font.bold = True
-                font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-                table = slide.shapes[0].table
-
-                currentRow = 1
-                colorToggle = True
-                for idx, row in afternoonBlock.iterrows():
-                    if colorToggle:
-                        color = RGBColor(0xFF, 0xFF, 0xFF)
-                    else:
-                        color = RGBColor(0xFA, 0xC0, 0x90)
-                    colorToggle = not colorToggle
-                    for col, value in enumerate(
-                        [
-                            "Start Time",
-                            "End Time",
-                            "Section Title",
-                            "Instructor",
-                            "Room",
-                        ]
-                    ):
-                        text_frame = table.rows[currentRow].cells[col].text_frame
-                        p = text_frame.paragraphs[0]
-                        run = p.add_run()
-                        if (value == "Instructor") and (
-                            (row["Instructor"] == "Instructor To Be Announced")
-                            or (pd.isnull(row["Instructor"]))
-                        ):
-                            run.text = "TBA"
-                        else:
-                            run.text = str(row[value]).lstrip("0")
-                        font = run.font
-                        fontSize = (
-                            65
-                            if 950 // len(afternoonBlock.index) >= 65
-                            else 950 // len(afternoonBlock.index)
-                        )
-                        font.size = Pt(fontSize)
-                        font.name = "Calibri"
-                        font.bold = True
-                        font.color.rgb = color
-                    currentRow += 1
-            else:
-                slide._element.set("show", "0")
-
-            slide = prs.slides[3]
-            if not eveningBlock.empty:
-                text_frame = slide.shapes[2].text_frame
-                text_frame.clear()
-                p = text_frame.paragraphs[0]
-                run = p.add_run()
-                run.text = (
-                    f"UC Berkeley Extension {dateList[i].strftime('%A')} "
-                    f"{dateList[i].strftime('%B %d, %Y').replace(' 0', ' ')}"
-                )
-                font = run.font
-                font.size = Pt(120)
-                font.name = "Calibri"
-                font.bold = True
-                font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-                table = slide.shapes[0].table
-
-                currentRow = 1
-                colorToggle = True
-                for idx, row in eveningBlock.iterrows():
-                    if colorToggle:
-                        color = RGBColor(0xFF, 0xFF, 0xFF)
-                    else:
-                        color = RGBColor(0xFA, 0xC0, 0x90)
-                    colorToggle = not colorToggle
-                    for col, value in enumerate(
-                        [
-                            "Start Time",
-                            "End Time",
-                            "Section Title",
-                            "Instructor",
-                            "Room",
-                        ]
-                    ):
-                        text_frame = table.rows[currentRow].cells[col].text_frame
-                        p = text_frame.paragraphs[0]
-                        run = p.add_run()
-                        if (value == "Instructor") and (
-                            (row["Instructor"] == "Instructor To Be Announced")
-                            or (pd.isnull(row["Instructor"]))
-                        ):
-                            run.text = "TBA"
-                        else:
-                            run.text = str(row[value]).lstrip("0")
-                        font = run.font
-                        fontSize = (
-                            65
-                            if 950 // len(eveningBlock.index) >= 65
-                            else 950 // len(eveningBlock.index)
-                        )
-                        font.size = Pt(fontSize)
-                        font.name = "Calibri"
-                        font.bold = True
-                        font.color.rgb = color
-                    currentRow += 1
-            else:
-                slide._element.set("show", "0")
-
-            # Save as Microsoft Powerpoint pptx file, per day
-            prs.save(
+        self.renderDays(
+            [
                 (
+                    template,
                     f"{self.saveSignsDirectory}\\{location} "
-                    f"{dateList[i].strftime('%Y-%m-%d')} "
-                    f"{dateList[i].strftime('%A')}.pptx"
+                    f"{Labels.isoDate(date)} {Labels.weekday(date)}.pptx",
+                    date,
+                    day,
                 )
-            )
-
+                for date, day in days
+            ],
+            SlideDecks.GBCDay,
+        )
         return 1
 
     def GBCScheduleToGSheets(
-        self, date: datetime.datetime, schedule: pd.DataFrame
+        self, date: datetime.datetime, schedule: list[Section]
     ) -> pygsheets.PyGsheetsException:
-        # Sort the schedule by time of day blocks
-        morningBlock = (
-            schedule.set_index("Start Time")
-            .between_time("00:00", "12:00", inclusive="left")
-            .reset_index()
-        )
-        afternoonBlock = (
-            schedule.set_index("Start Time")
-            .between_time("12:00", "17:00", inclusive="left")
-            .reset_index()
-        )
-        eveningBlock = (
-            schedule.set_index("Start Time")
-            .between_time("17:00", "00:00", inclusive="left")
-            .reset_index()
-        )
-
-        morningBlock["Start Time"] = morningBlock["Start Time"].dt.strftime("%I:%M %p")
-        morningBlock["End Time"] = morningBlock["End Time"].dt.strftime("%I:%M %p")
-        afternoonBlock["Start Time"] = afternoonBlock["Start Time"].dt.strftime(
-            "%I:%M %p"
-        )
-        afternoonBlock["End Time"] = afternoonBlock["End Time"].dt.strftime("%I:%M %p")
-        eveningBlock["Start Time"] = eveningBlock["Start Time"].dt.strftime("%I:%M %p")
-        eveningBlock["End Time"] = eveningBlock["End Time"].dt.strftime("%I:%M %p")
-
-        blockList = [
-            ("Morning", morningBlock),
-            ("Afternoon", afternoonBlock),
-            ("Evening", eveningBlock),
-        ]
-        dirpath = os.getcwd()
+        # Lay out the worksheet of each time of day block
+        grids = ScheduleSheets.GBCGrids(date, schedule)
 
         # Connect to Google Sheets and update with current schedule
-        client = pygsheets.authorize(service_file=f"{dirpath}/service_file.json")
         try:
-            sheet = client.open_by_url(self.GBCScheduleURL)
+            sheet = ScheduleSheets.open(self.GBCScheduleURL)
         except pygsheets.SpreadsheetNotFound as error:
             print(error)
             return error
-        finally:
-            for i in range(len(blockList)):
-                wks = sheet.worksheet_by_title(blockList[i][0])
-                wks.clear(start="A1", end=None, fields="*")
-                wks.update_value(
-                    "A1",
-                    (
-                        f"UC Berkeley Extension - {date.strftime('%A')}, "
-                        f"{date.strftime('%B %d, %Y').replace(' 0', ' ')}"
-                    ),
-                )
-                wks.set_dataframe(
-                    blockList[i][1][
-                        [
-                            "Start Time",
-                            "End Time",
-                            "Section Title",
-                            "Instructor",
-                            "Room",
-                        ]
-                    ],
-                    "A2",
-                    fit=True,
-                )
 
-    def SFCppt(self, schedule: pd.DataFrame, location: str, template: str) -> int:
-        # Sort the schedule
-        sortedSchedule = schedule.sort_values(by=["Date", "Start Time", "Room"])
-        sortedSchedule = sortedSchedule.fillna("")
-        dateList = sortedSchedule["Date"].dt.date.unique()
-
-        # Upload SFC schedule if setting and URL are set in config.ini file
-        if self.uploadSFCSchedule and self.SFCScheduleURL:
-            self.SFCScheduleToGSheets(
-                dateList[0],
-                sortedSchedule.loc[sortedSchedule["Date"].dt.date == dateList[0], :],
-            )
-
-        # Write out schedule one block per slide. Hide slide if no classes.
-        for i in range(0, len(dateList)):
-            singleDaySched = sortedSchedule.loc[
-                sortedSchedule["Date"].dt.date == dateList[i], :
-            ]
-            daytimeBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("00:00", "17:00", inclusive="left")
-                .reset_index()
-            )
-            daytimeBlock["Start Time"] = daytimeBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            daytimeBlock["End Time"] = daytimeBlock["End Time"].dt.strftime("%I:%M %p")
-            daytimeBlock = daytimeBlock.sort_values(by=["Room", "Start Time"])
-            daytime5thFlr = daytimeBlock.loc[daytimeBlock["Room"] <= "Classroom 515", :]
-            daytime6thFlr = daytimeBlock.loc[
-                (daytimeBlock["Room"] >= "Classroom 602")
-                & (daytimeBlock["Room"] <= "Classroom 613"),
-                :,
-            ]
-            daytime7thFlr = daytimeBlock.loc[daytimeBlock["Room"] >= "Classroom 702", :]
+        # Each worksheet is sized to fit its grid
+        ScheduleSheets.push(
+            sheet,
+            grids,
+            {title: (len(grid), 5) for title, grid in grids.items()},
+            self.sheetsSnapshotPath(self.GBCScheduleURL),
+            self.sheetsSync == "diff",
+        )
 
-            eveningBlock = (
-                singleDaySched.set_index("Start Time")
-                .between_time("17:00", "00:00", inclusive="left")
-                .reset_index()
-            )
-            eveningBlock["Start Time"] = eveningBlock["Start Time"].dt.strftime(
-                "%I:%M %p"
-            )
-            eveningBlock["End Time"] = eveningBlock["End Time"].dt.strftime("%I:%M %p")
-            eveningBlock = eveningBlock.sort_values(by=["Room", "Start Time"])
-            evening5thFlr = eveningBlock.loc[eveningBlock["Room"] <= "Classroom 515", :]
-            evening6thFlr = eveningBlock.loc[
-                (eveningBlock["Room"] >= "Classroom 602")
-                & (eveningBlock["Room"] <= "Classroom 613"),
-                :,
-            ]
-            evening7thFlr = eveningBlock.loc[eveningBlock["Room"] >= "Classroom 702", :]
-
-            # Max font size Pt(60). Scale font size down based on number of rows used.
-            daytimeRowCount = (
-                len(daytime5thFlr.index)
-                + 2 * (not daytime5thFlr.empty)
-                + len(daytime6thFlr.index)
-                + 2 * (not daytime6thFlr.empty)
-                + len(daytime7thFlr.index)
-                + 1 * (not daytime7thFlr.empty)
-            )
-            daytimeFontSize = -1.0603 * daytimeRowCount + 72.336
-            if daytimeFontSize > 60:
-                daytimeFontSize = 60
-            eveningRowCount = (
-                len(evening5thFlr.index)
-                + 2 * (not evening5thFlr.empty)
-                + len(evening6thFlr.index)
-                + 2 * (not evening6thFlr.empty)
-                + len(evening7thFlr.index)
-                + 1 * (not evening7thFlr.empty)
-            )
-            eveningFontSize = -1.0603 * eveningRowCount + 72.336
-            if eveningFontSize > 60:
-                eveningFontSize = 60
-
-            prs = Presentation(template)
-
-            slide = prs.slides[1]
-            if not daytimeBlock.empty:
-                text_frame = slide.shapes[2].text_frame
-                text_frame.clear()
-                p = text_frame.paragraphs[0]
-                run = p.add_run()
-                run.text = (
-                    f"UC Berkeley Extension - {dateList[i].strftime('%A')}, "
-                    f"{dateList[i].strftime('%B %d, %Y').replace(' 0', ' ')}"
-                )
-                font = run.font
-                font.size = Pt(70)
-                font.name = "Calibri"
-                font.bold = True
-                font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-                table = slide.shapes[0].table
-
-                currentRow = 0
-                if not daytime5thFlr.empty:
-                    text_frame = table.rows[currentRow].cells[0].text_frame
-                    p = text_frame.paragraphs[0]
-                    run = p.add_run()
-                    run.text = "5th Floor"
-                    font = run.font
-                    font.size = Pt(int(daytimeFontSize))
-                    font.name = "Arial"
-                    font.bold = True
-                    font.underline = True
-                    font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-
-                    text_frame = table.rows[currentRow].cells[4].text_frame
-                    p = text_frame.paragraphs[0]
-                    run = p.add_run()
-                    run.text = "Room"
-                    font = run.font
-                    font.size = Pt(int(daytimeFontSize))
-                    font.name = "Arial"
-                    font.bold = True
-                    font.underline = True
-                    font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-
-                    currentRow += 1
-                    colorToggle = True
-
-                    for idx, row in daytime5thFlr.iterrows():
-                        if colorToggle:
-                            color = RGBColor(0xFF, 0xFF, 0xFF)
-                        else:
-                            color = RGBColor(0xFA, 0xC0, 0x90)
-                        colorToggle = not colorToggle
-                        for col, value in enumerate(
-                            [
-                                "Start Time",
-                                "End Time",
-                                "Section Number",
-                                "Section Title",
-                                "Room",
-                            ]
-                        ):
-                            text_frame = table.rows[currentRow].cells[col].text_frame
-                            p = text_frame.paragraphs[0]
-                            run = p.add_run()
-                            if value == "Start Time" or value == "End Time":
-                                run.text = str(row[value]).lstrip("0")
-                            elif value == "Room":
-                                run.text = str(row[value]).lstrip("Classroom")
-                            else:
-                                run.text = str(row[value])
-                            font = run.font
-                            font.size = Pt(int(daytimeFontSize))
-                            font.name = "Arial"
-                            font.bold = True
-                            font.color.rgb = color
-                        currentRow += 1
-                    currentRow += 1
-
-                if not daytime6thFlr.empty:
-                    text_frame = table.rows[currentRow].cells[0].text_frame
-                    p = text_frame.paragraphs[0]
-                    run = p.add_run()
-                    run.text = "6th Floor"
-                    font = run.font
-                    font.size = Pt(int(daytimeFontSize))
-                    font.name = "Arial"
-                    font.bold = True
-                    font.underline = True
-                    font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-
-                    text_frame = table.rows[currentRow].cells[4].text_frame
-                    p = text_frame.paragraphs[0]
-                    run = p.add_run()
-                    run.text = "Room"
-                    font = run.font
-                    font.size = Pt(int(daytimeFontSize))
-                    font.name = "Arial"
-                    font.bold = True
-                    font.underline = True
-                    font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-
-                    currentRow += 1
-                    colorToggle = True
-
-                    for idx, row in daytime6thFlr.iterrows():
-                        if colorToggle:
-                            color = RGBColor(0xFF, 0xFF, 0xFF)
-                        else:
-                            color = RGBColor(0xFA, 0xC0, 0x90)
-                        colorToggle = not colorToggle
-                        for col, value in enumerate(
-                            [
-                                "Start Time",
-                                "End Time",
-                                "Section Number",
-                                "Section Title",
-                                "Room",
-                            ]
-                        ):
-                            text_frame = table.rows[currentRow].cells[col].text_frame
-                            p = text_frame.paragraphs[0]
-                            run = p.add_run()
-                            if value == "Start Time" or value == "End Time":
-                                run.text = str(row[value]).lstrip("0")
-                            elif value == "Room":
-                                run.text = str(row[value]).lstrip("Classroom")
-                            else:
-                                run.text = str(row[value])
-                            font = run.font
-                            font.size = Pt(int(daytimeFontSize))
-                            font.name = "Arial"
-                            font.bold = True
-                            font.color.rgb = color
-                        currentRow += 1
-                    currentRow += 1
-
-                if not daytime7thFlr.empty:
-                    text_frame = table.rows[currentRow].cells[0].text_frame
-                    p = text_frame.paragraphs[0]
-                    run = p.add_run()
-                    run.text = "7th Floor"
-                    font = run.font
-                    font.size = Pt(int(daytimeFontSize))
-                    font.name = "Arial"
-                    font.bold = True
-                    font.underline = True
-                    font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-
-                    text_frame = table.rows[currentRow].cells[4].text_frame
-                    p = text_frame.paragraphs[0]
-                    run = p.add_run()
-                    run.text = "Room"
-                    font = run.font
-                    font.size = Pt(int(daytimeFontSize))
-                    font.name = "Arial"
-                    font.bold = True
-                    font.underline = True
-                    font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-
-                    currentRow += 1
-                    colorToggle = True
-
-                    for idx, row in daytime7thFlr.iterrows():
-                        if colorToggle:
-                            color = RGBColor(0xFF, 0xFF, 0xFF)
-                        else:
-                            color = RGBColor(0xFA, 0xC0, 0x90)
-                        colorToggle = not colorToggle
-                        for col, value in enumerate(
-                            [
-                                "Start Time",
-                                "End Time",
-                                "Section Number",
-                                "Section Title",
-                                "Room",
-                            ]
-                        ):
-                            text_frame = table.rows[currentRow].cells[col].text_frame
-                            p = text_frame.paragraphs[0]
-                            run = p.add_run()
-                            if value == "Start Time" or value == "End Time":
-                                run.text = str(row[value]).lstrip("0")
-                            elif value == "Room":
-                                run.text = str(row[value]).lstrip("Classroom")
-                            else:
-                                run.text = str(row[value])
-                            font = run.font
-                            font.size = Pt(int(daytimeFontSize))
-                            font.name = "Arial"
-                            font.bold = True
-                            font.color.rgb = color
-                        currentRow += 1
-            else:
-                slide._element.set("show", "0")
+    def sheetsSnapshotPath(self, url: str) -> str:
+        # Last uploaded grids of a spreadsheet, kept with the schedule cache.
+        # sheetsSync "diff" uploads only what changed since then.
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.scheduleCacheDirectory, f"sheets-{digest}.json")
 
-            slide = prs.slides[2]
-            if not eveningBlock.empty:
-                text_frame = slide.shapes[2].text_frame
-                text_frame.clear()
-                p = text_frame.paragraphs[0]
-                run = p.add_run()
-                run.text = (
-                    f"UC Berkeley Extension - {dateList[i].strftime('%A')}, "
-                    f"{dateList[i].strftime('%B %d, %Y').replace(' 0', ' ')}"
-                )
-                font = run.font
-                font.size = Pt(70)
-                font.name = "Calibri"
-                font.bold = True
-                font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-                table = slide.shapes[0].table
-
-                currentRow = 0
-                if not evening5thFlr.empty:
-                    text_frame = table.rows[currentRow].cells[0].text_frame
-                    p = text_frame.paragraphs[0]
-                    run = p.add_run()
-                    run.text = "5th Floor"
-                    font = run.font
-                    font.size = Pt(int(eveningFontSize))
-                    font.name = "Arial"
-                    font.bold = True
-                    font.underline = True
-                    font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-
-                    text_frame = table.rows[currentRow].cells[4].text_frame
-                    p = text_frame.paragraphs[0]
-                    run = p.add_run()
-                    run.text = "Room"
-                    font = run.font
-                    font.size = Pt(int(eveningFontSize))
-                    font.name = "Arial"
-                    font.bold = True
-                    font.underline = True
-                    font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-
-                    currentRow += 1
-                    colorToggle = True
-
-                    for idx, row in evening5thFlr.iterrows():
-                        if colorToggle:
-                            color = RGBColor(0xFF, 0xFF, 0xFF)
-                        else:
-                            color = RGBColor(0xFA, 0xC0, 0x90)
-                        colorToggle = not colorToggle
-                        for col, value in enumerate(
-                            [
-                                "Start Time",
-                                "End Time",
-                                "Section Number",
-                                "Section Title",
-                                "Room",
-                            ]
-                        ):
-                            text_frame = table.rows[currentRow].cells[col].text_frame
-                            p = text_frame.paragraphs[0]
-                            run = p.add_run()
-                            if value == "Start Time" or value == "End Time":
-                                run.text = str(row[value]).lstrip("0")
-                            elif value == "Room":
-                                run.text = str(row[value]).lstrip("Classroom")
-                            else:
-                                run.text = str(row[value])
-                            font = run.font
-                            font.size = Pt(int(eveningFontSize))
-                            font.name = "Arial"
-                            font.bold = True
-                            font.color.rgb = color
-                        currentRow += 1
-                    currentRow += 1
-
-                if not evening6thFlr.empty:
-                    text_frame = table.rows[currentRow].cells[0].text_frame
-                    p = text_frame.paragraphs[0]
-                    run = p.add_run()
-                    run.text = "6th Floor"
-                    font = run.font
-                    font.size = Pt(int(eveningFontSize))
-                    font.name = "Arial"
-                    font.bold = True
-                    font.underline = True
-                    font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-
-                    text_frame = table.rows[currentRow].cells[4].text_frame
-                    p = text_frame.paragraphs[0]
-                    run = p.add_run()
-                    run.text = "Room"
-                    font = run.font
-                    font.size = Pt(int(eveningFontSize))
-                    font.name = "Arial"
-                    font.bold = True
-                    font.underline = True
-                    font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-
-                    currentRow += 1
-                    colorToggle = True
-
-                    for idx, row in evening6thFlr.iterrows():
-                        if colorToggle:
-                            color = RGBColor(0xFF, 0xFF, 0xFF)
-                        else:
-                            color = RGBColor(0xFA, 0xC0, 0x90)
-                        colorToggle = not colorToggle
-                        for col, value in enumerate(
-                            [
-                                "Start Time",
-                                "End Time",
-                                "Section Number",
-                                "Section Title",
-                                "Room",
-                            ]
-                        ):
-                            text_frame = table.rows[currentRow].cells[col].text_frame
-                            p = text_frame.paragraphs[0]
-                            run = p.add_run()
-                            if value == "Start Time" or value == "End Time":
-                                run.text = str(row[value]).lstrip("0")
-                            elif value == "Room":
-                                run.text = str(row[value]).lstrip("Classroom")
-                            else:
-                                run.text = str(row[value])
-                            font = run.font
-                            font.size = Pt(int(eveningFontSize))
-                            font.name = "Arial"
-                            font.bold = True
-                            font.color.rgb = color
-                        currentRow += 1
-                    currentRow += 1
-
-                if not evening7thFlr.empty:
-                    text_frame = table.rows[currentRow].cells[0].text_frame
-                    p = text_frame.paragraphs[0]
-                    run = p.add_run()
-                    run.text = "7th Floor"
-                    font = run.font
-                    font.size = Pt(int(eveningFontSize))
-                    font.name = "Arial"
-                    font.bold = True
-                    font.underline = True
-                    font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-
-                    text_frame = table.rows[currentRow].cells[4].text_frame
-                    p = text_frame.paragraphs[0]
-                    run = p.add_run()
-                    run.text = "Room"
-                    font = run.font
-                    font.size = Pt(int(eveningFontSize))
-                    font.name = "Arial"
-                    font.bold = True
-                    font.underline = True
-                    font.color.rgb = RGBColor(0xFF, 0xFF, 0x00)
-
-                    currentRow += 1
-                    colorToggle = True
-
-                    for idx, row in evening7thFlr.iterrows():
-                        if colorToggle:
-                            color = RGBColor(0xFF, 0xFF, 0xFF)
-                        else:
-                            color = RGBColor(0xFA, 0xC0, 0x90)
-                        colorToggle = not colorToggle
-                        for col, value in enumerate(
-                            [
-                                "Start Time",
-                                "End Time",
-                                "Section Number",
-                                "Section Title",
-                                "Room",
-                            ]
-                        ):
-                            text_frame = table.rows[currentRow].cells[col].text_frame
-                            p = text_frame.paragraphs[0]
-                            run = p.add_run()
-                            if value == "Start Time" or value == "End Time":
-                                run.text = str(row[value]).lstrip("0")
-                            elif value == "Room":
-                                run.text = str(row[value]).lstrip("Classroom")
-                            else:
-                                run.text = str(row[value])
-                            font = run.font
-                            font.size = Pt(int(eveningFontSize))
-                            font.name = "Arial"
-                            font.bold = True
-                            font.color.rgb = color
-                        currentRow += 1
-            else:
-                slide._element.set("show", "0")
+    def SFCppt(self, schedule: pd.DataFrame, location: str, template: str) -> int:
+        # Sort once and split into per-day lists of section records
+        days = Section.days(schedule, by=["Start Time", "Room"])
 
-            # Save as Microsoft Powerpoint pptx file, per day
-            prs.save(
+        # Write out schedule one block per slide. Hide slide if no classes.
+        self.renderDays(
+            [
                 (
+                    template,
                     f"{self.saveSignsDirectory}\\{location} "
-                    f"{dateList[i].strftime('%Y-%m-%d')} "
-                    f"{dateList[i].strftime('%A')}.pptx"
+                    f"{Labels.isoDate(date)} {Labels.weekday(date)}.pptx",
+                    date,
+                    day,
                 )
-            )
+                for date, day in days
+            ],
+            SlideDecks.SFCDay,
+        )
         return 1
 
     def SFCScheduleToGSheets(
-        self, date: datetime.datetime, schedule: pd.DataFrame
+        self, date: datetime.datetime, schedule: list[Section]
     ) -> pygsheets.PyGsheetsException:
-        # Sort schedule by time of day blocks and floor
-        daytimeBlock = (
-            schedule.set_index("Start Time")
-            .between_time("00:00", "17:00", inclusive="left")
-            .reset_index()
-        )
-        daytimeBlock = daytimeBlock.sort_values(by=["Room", "Start Time"])
-        daytimeBlock["Start Time"] = daytimeBlock["Start Time"].dt.strftime("%I:%M %p")
-        daytimeBlock["End Time"] = daytimeBlock["End Time"].dt.strftime("%I:%M %p")
-        daytime5thFlr = daytimeBlock.loc[daytimeBlock["Room"] <= "Classroom 515", :]
-        daytime6thFlr = daytimeBlock.loc[
-            (daytimeBlock["Room"] >= "Classroom 602")
-            & (daytimeBlock["Room"] <= "Classroom 613"),
-            :,
-        ]
-        daytime7thFlr = daytimeBlock.loc[daytimeBlock["Room"] >= "Classroom 702", :]
-
-        eveningBlock = (
-            schedule.set_index("Start Time")
-            .between_time("17:00", "00:00", inclusive="left")
-            .reset_index()
-        )
-        eveningBlock["Start Time"] = eveningBlock["Start Time"].dt.strftime("%I:%M %p")
-        eveningBlock["End Time"] = eveningBlock["End Time"].dt.strftime("%I:%M %p")
-        eveningBlock = eveningBlock.sort_values(by=["Room", "Start Time"])
-        evening5thFlr = eveningBlock.loc[eveningBlock["Room"] <= "Classroom 515", :]
-        evening6thFlr = eveningBlock.loc[
-            (eveningBlock["Room"] >= "Classroom 602")
-            & (eveningBlock["Room"] <= "Classroom 613"),
-            :,
-        ]
-        evening7thFlr = eveningBlock.loc[eveningBlock["Room"] >= "Classroom 702", :]
-
-        blockList = ["Daytime", "Evening"]
-        floorList = [
-            (
-                ("5th Floor", daytime5thFlr),
-                ("6th Floor", daytime6thFlr),
-                ("7th Floor", daytime7thFlr),
-            ),
-            (
-                ("5th Floor", evening5thFlr),
-                ("6th Floor", evening6thFlr),
-                ("7th Floor", evening7thFlr),
-            ),
-        ]
+        # Lay out the worksheet of each time of day block, by floor
+        grids = ScheduleSheets.SFCGrids(date, schedule)
 
         # Connect to Google Sheets and update with current schedule
-        dirpath = os.getcwd()
-        client = pygsheets.authorize(service_file=f"{dirpath}/service_file.json")
         try:
-            sheet = client.open_by_url(self.SFCScheduleURL)
+            sheet = ScheduleSheets.open(self.SFCScheduleURL)
         except pygsheets.SpreadsheetNotFound as error:
             print(error)
             return error
-        finally:
-            for i in range(len(blockList)):
-                wks = sheet.worksheet_by_title(blockList[i])
-                wks.clear(start="A1", end=None, fields="*")
-                wks.resize(len(schedule.index) + 6, 5)
-                wks.update_value(
-                    "A1",
-                    (
-                        f"UC Berkeley Extension - {date.strftime('%A')}, "
-                        f"{date.strftime('%B %d, %Y').replace(' 0', ' ')}"
-                    ),
-                )
-                wks.update_row(
-                    2, ["Start Time", "End Time", "Section Title", "Instructor", "Room"]
-                )
-                rowNumber = 3
-                for floor in floorList[i]:
-                    if not floor[1].empty:
-                        wks.update_value(f"A{rowNumber}", floor[0])
-                        rowNumber += 1
-                        wks.set_dataframe(
-                            floor[1][
-                                [
-                                    "Start Time",
-                                    "End Time",
-                                    "Section Title",
-                                    "Instructor",
-                                    "Room",
-                                ]
-                            ],
-                            f"A{rowNumber}",
-                            copy_head=False,
-                            fit=False,
-                        )
-                        rowNumber += len(floor[1].index) + 1
+
+        # Every worksheet has room for all of the day's sections, and for its
+        # whole grid when the floor headings and blank rows make that longer
+        ScheduleSheets.push(
+            sheet,
+            grids,
+            {
+                title: (max(len(grid), len(schedule) + 6), 5)
+                for title, grid in grids.items()
+            },
+            self.sheetsSnapshotPath(self.SFCScheduleURL),
+            self.sheetsSync == "diff",
+        )
 
 
 if __name__ == "__main__":
+    # Lets the frozen executable start classroom sign worker processes
+    multiprocessing.freeze_support()
     # os.environ["QT_AUTO_SCREEN_FACTOR"] = "1"
     app = QtWidgets.QApplication(sys.argv)
     mainWindow = QtWidgets.QWidget()
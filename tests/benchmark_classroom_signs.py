@@ -0,0 +1,38 @@
+# Time one day of classroom signs with each backend.
+# Run from the repository root: python -m tests.benchmark_classroom_signs
+import tempfile
+import timeit
+
+import pandas as pd
+
+from tests.helpers import AutoSigns, docxTemplate, section
+
+ClassroomSigns = AutoSigns.ClassroomSigns
+
+
+def main(rooms: int = 40, sectionsPerRoom: int = 3, repeat: int = 5) -> None:
+    date = pd.Timestamp("2026-01-05")
+    roomDays = AutoSigns.RoomDay.group(
+        [
+            section(f"Classroom {100 + room}", 480 + index * 180, 600, f"Course {room}")
+            for room in range(rooms)
+            for index in range(sectionsPerRoom)
+        ]
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        template = docxTemplate(directory)
+        for renderDay in (ClassroomSigns.docxDay, ClassroomSigns.xmlDay):
+            path = f"{directory}/{renderDay.__name__}.docx"
+            renderDay("GBC", template, path, date, roomDays)  # Warm the caches
+            seconds = min(
+                timeit.repeat(
+                    lambda: renderDay("GBC", template, path, date, roomDays),
+                    number=1,
+                    repeat=repeat,
+                )
+            )
+            print(f"{renderDay.__name__}: {seconds * 1000:.1f} ms for {rooms} signs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Shared setup for the tests. AutoSigns.py is a script, so it is imported from
+# the repository root, and templates are generated instead of shipped.
+import datetime
+import os
+import sys
+
+from docx import Document
+from pptx import Presentation
+from pptx.util import Pt
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import AutoSigns  # noqa: E402
+
+
+def docxTemplate(directory: str) -> str:
+    path = os.path.join(directory, "Template.docx")
+    doc = Document()
+    doc.add_paragraph("Template placeholder")
+    doc.save(path)
+    return path
+
+
+def pptxTemplate(
+    directory: str, rows: int, columnWidths: list[int], headerHeight: int = 30
+) -> str:
+    # A 960x540pt deck laid out like the GBC template: a welcome slide, then a
+    # slide per block with the table, a logo and the heading, in that order
+    path = os.path.join(directory, "Template.pptx")
+    prs = Presentation()
+    prs.slide_width, prs.slide_height = Pt(960), Pt(540)
+    layout = prs.slide_layouts[6]
+    prs.slides.add_slide(layout)
+    for _ in AutoSigns.Schedule.blocks["GBC"]:
+        slide = prs.slides.add_slide(layout)
+        table = slide.shapes.add_table(
+            rows, len(columnWidths), Pt(30), Pt(60), Pt(sum(columnWidths)), Pt(450)
+        ).table
+        for column, width in zip(table.columns, columnWidths):
+            column.width = Pt(width)
+        table.rows[0].height = Pt(headerHeight)
+        slide.shapes.add_textbox(Pt(800), Pt(5), Pt(100), Pt(40))
+        slide.shapes.add_textbox(Pt(30), Pt(5), Pt(700), Pt(40))
+    prs.save(path)
+    return path
+
+
+def section(
+    room: str, start: int, end: int, title: str, center: str = "GBC"
+) -> AutoSigns.Section:
+    # A section on 2026-01-05, in the block and floor its center puts it in
+    block = next(
+        name
+        for name, first, last in AutoSigns.Schedule.blocks[center]
+        if first <= start < last
+    )
+    floor = AutoSigns.Schedule.roomFloor(
+        room, AutoSigns.Schedule.floorRanges.get(center, [])
+    )
+    return AutoSigns.Section(
+        datetime.date(2026, 1, 5),
+        start,
+        end,
+        f"X{start}",
+        title,
+        "Instructor To Be Announced",
+        "San Francisco Center" if center == "SFC" else "Golden Bear Center",
+        room,
+        block,
+        floor,
+    )
@@ -0,0 +1,188 @@
+# Local stand-in for the parts of the Google Sheets v4 REST API that the
+# schedule uploads use. Worksheets live in memory, every request is counted by
+# kind, and queued failures are answered in place of the next requests so
+# retries can be exercised.
+import json
+import re
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httplib2
+import pygsheets
+from google.auth.credentials import AnonymousCredentials
+
+
+class SheetsStub(object):
+    def __init__(self, titles: dict[str, list[str]]) -> None:
+        # Spreadsheet key -> worksheet title -> size, cells and sheet id
+        self.spreadsheets = {
+            key: {
+                title: {"id": index, "rows": 1000, "cols": 26, "cells": {}}
+                for index, title in enumerate(names)
+            }
+            for key, names in titles.items()
+        }
+        # Kind of every request received, and (status, headers) answers to
+        # give the next requests instead of handling them
+        self.requests = []
+        self.failures = []
+        self.server = None
+
+    def start(self) -> None:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                stub.handle(self, "GET")
+
+            def do_POST(self) -> None:
+                stub.handle(self, "POST")
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(
+            target=self.server.serve_forever, args=(0.01,), daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def client(self) -> pygsheets.client.Client:
+        # A pygsheets client whose requests go to this server, configured as
+        # ScheduleSheets.open authorizes its own
+        port = self.server.server_address[1]
+
+        class Http(httplib2.Http):
+            def request(self, uri: str, *args, **kwargs):
+                uri = uri.replace(
+                    "https://sheets.googleapis.com", f"http://127.0.0.1:{port}"
+                )
+                return super().request(uri, *args, **kwargs)
+
+        return pygsheets.client.Client(
+            AnonymousCredentials(), http=Http(), retries=0, check=False
+        )
+
+    def grid(self, key: str, title: str) -> list[list[str]]:
+        # Worksheet values as rows of strings, without trailing blank cells
+        cells = self.spreadsheets[key][title]["cells"]
+        rows = max((row for row, _ in cells), default=-1) + 1
+        grid = []
+        for row in range(rows):
+            cols = max((col + 1 for r, col in cells if r == row), default=0)
+            grid.append([cells.get((row, col), "") for col in range(cols)])
+        return grid
+
+    def size(self, key: str, title: str) -> tuple[int, int]:
+        worksheet = self.spreadsheets[key][title]
+        return worksheet["rows"], worksheet["cols"]
+
+    def handle(self, handler: BaseHTTPRequestHandler, method: str) -> None:
+        url = urllib.parse.urlparse(handler.path)
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = json.loads(handler.rfile.read(length) or b"{}")
+        key, rest = re.match(
+            r"/v4/spreadsheets/([^/:]+)(.*)", urllib.parse.unquote(url.path)
+        ).groups()
+        kind = {
+            ("GET", ""): "get",
+            ("POST", ":batchUpdate"): "batchUpdate",
+            ("POST", "/values:batchUpdate"): "values.batchUpdate",
+        }.get((method, rest), f"{method} {rest}")
+        self.requests.append(kind)
+
+        if self.failures:
+            status, headers = self.failures.pop(0)
+            return self.reply(handler, status, {"error": {"code": status}}, headers)
+        if key not in self.spreadsheets:
+            return self.reply(handler, 404, {"error": {"code": 404}})
+        worksheets = self.spreadsheets[key]
+        if kind == "get":
+            return self.reply(
+                handler,
+                200,
+                {
+                    "spreadsheetId": key,
+                    "properties": {"title": key, "defaultFormat": {}},
+                    "namedRanges": [],
+                    "sheets": [
+                        {
+                            "properties": {
+                                "sheetId": worksheet["id"],
+                                "title": title,
+                                "index": worksheet["id"],
+                                "sheetType": "GRID",
+                                "gridProperties": {
+                                    "rowCount": worksheet["rows"],
+                                    "columnCount": worksheet["cols"],
+                                },
+                            }
+                        }
+                        for title, worksheet in worksheets.items()
+                    ],
+                },
+            )
+        if kind == "batchUpdate":
+            byId = {worksheet["id"]: worksheet for worksheet in worksheets.values()}
+            for request in body["requests"]:
+                if "updateCells" in request:
+                    worksheet = byId[request["updateCells"]["range"]["sheetId"]]
+                    worksheet["cells"].clear()
+                elif "updateSheetProperties" in request:
+                    properties = request["updateSheetProperties"]["properties"]
+                    worksheet = byId[properties["sheetId"]]
+                    grid = properties["gridProperties"]
+                    worksheet["rows"] = grid["rowCount"]
+                    worksheet["cols"] = grid["columnCount"]
+                    worksheet["cells"] = {
+                        (row, col): value
+                        for (row, col), value in worksheet["cells"].items()
+                        if row < worksheet["rows"] and col < worksheet["cols"]
+                    }
+            return self.reply(handler, 200, {"spreadsheetId": key, "replies": []})
+        if kind == "values.batchUpdate":
+            # Writing outside a worksheet's grid fails the whole request, as
+            # the Sheets API does
+            writes = []
+            for data in body["data"]:
+                title, cell = data["range"].rsplit("!", 1)
+                worksheet = worksheets[title.strip("'")]
+                column, row = re.match(r"([A-Z]+)(\d+)", cell).groups()
+                firstCol = 0
+                for letter in column:
+                    firstCol = firstCol * 26 + ord(letter) - ord("A") + 1
+                firstCol -= 1
+                firstRow = int(row) - 1
+                for rowOffset, values in enumerate(data["values"]):
+                    for colOffset, value in enumerate(values):
+                        row, col = firstRow + rowOffset, firstCol + colOffset
+                        if row >= worksheet["rows"] or col >= worksheet["cols"]:
+                            return self.reply(handler, 400, {"error": {"code": 400}})
+                        writes.append((worksheet, (row, col), str(value)))
+            for worksheet, cell, value in writes:
+                if value:
+                    worksheet["cells"][cell] = value
+                else:
+                    worksheet["cells"].pop(cell, None)
+            return self.reply(handler, 200, {"spreadsheetId": key})
+        return self.reply(handler, 404, {"error": {"code": 404}})
+
+    @staticmethod
+    def reply(
+        handler: BaseHTTPRequestHandler,
+        status: int,
+        content: dict,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        data = json.dumps(content).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(data)
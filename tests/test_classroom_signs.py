@@ -0,0 +1,65 @@
+import tempfile
+import unittest
+import zipfile
+
+import pandas as pd
+
+from tests.helpers import AutoSigns, docxTemplate, section
+
+ClassroomSigns = AutoSigns.ClassroomSigns
+RoomDay = AutoSigns.RoomDay
+
+
+class ClassroomSignsTest(unittest.TestCase):
+    date = pd.Timestamp("2026-01-05")
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.template = docxTemplate(self.directory.name)
+        ClassroomSigns.packages.clear()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def roomDays(self, titles: list[str]) -> list:
+        sections = [
+            section(f"Classroom {101 + index // 2}", 540 + index * 60, 600, title)
+            for index, title in enumerate(titles)
+        ]
+        return RoomDay.group(sections)
+
+    def render(self, renderDay, location: str, roomDays: list) -> dict[str, bytes]:
+        path = f"{self.directory.name}/{renderDay.__name__}-{location}.docx"
+        renderDay(location, self.template, path, self.date, roomDays)
+        with zipfile.ZipFile(path) as docx:
+            return {info.filename: docx.read(info) for info in docx.infolist()}
+
+    def testXmlDayMatchesDocxDay(self) -> None:
+        # Every part of the package, document.xml included, is byte for byte
+        # what python-docx writes
+        titles = [
+            "Accounting & Finance <Intro>",
+            "  Leading spaces",
+            "Tab\tand\nline break",
+            "Unicode café",
+            "One room alone",
+        ]
+        for location in ("GBC", "SFC"):
+            with self.subTest(location=location):
+                self.assertEqual(
+                    self.render(
+                        ClassroomSigns.docxDay, location, self.roomDays(titles)
+                    ),
+                    self.render(ClassroomSigns.xmlDay, location, self.roomDays(titles)),
+                )
+
+    def testControlCharactersAreRejected(self) -> None:
+        roomDays = self.roomDays(["Vertical\x0btab"])
+        for renderDay in (ClassroomSigns.docxDay, ClassroomSigns.xmlDay):
+            with self.subTest(renderDay=renderDay.__name__):
+                with self.assertRaises(ValueError):
+                    self.render(renderDay, "GBC", roomDays)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+import datetime
+import os
+import ssl
+import tempfile
+import unittest
+from unittest import mock
+
+import httplib2
+from google.auth.exceptions import TransportError
+from googleapiclient.errors import HttpError
+
+from tests.helpers import AutoSigns, section
+from tests.sheetsstub import SheetsStub
+
+ScheduleSheets = AutoSigns.ScheduleSheets
+
+
+class ScheduleSheetsTest(unittest.TestCase):
+    date = datetime.date(2026, 1, 5)
+
+    def setUp(self) -> None:
+        self.stub = SheetsStub(
+            {"gbc": ["Morning", "Afternoon", "Evening"], "sfc": ["Daytime", "Evening"]}
+        )
+        self.stub.start()
+        self.addCleanup(self.stub.stop)
+        self.cache = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache.cleanup)
+
+        ScheduleSheets.client = self.stub.client()
+        ScheduleSheets.spreadsheets = {}
+        ScheduleSheets.tokens = ScheduleSheets.writeBurst
+        # Backoff and rate limiting waits are recorded instead of slept
+        sleep = mock.patch("time.sleep")
+        self.sleep = sleep.start()
+        self.addCleanup(sleep.stop)
+        self.ui = AutoSigns.Ui_mainWindow()
+        self.ui.scheduleCacheDirectory = self.cache.name
+        self.ui.sheetsSync = "full"
+        self.ui.GBCScheduleURL = "https://docs.google.com/spreadsheets/d/gbc/edit"
+        self.ui.SFCScheduleURL = "https://docs.google.com/spreadsheets/d/sfc/edit"
+
+    @staticmethod
+    def written(grid: list[list[str]]) -> list[list[str]]:
+        # The grid as the stand-in reads it back, without trailing blank rows
+        while grid and not any(grid[-1]):
+            grid = grid[:-1]
+        return grid
+
+    def GBCDay(self) -> list:
+        return [
+            section("Classroom 101", 540, 600, "Morning course"),
+            section("Classroom 102", 780, 840, "Afternoon course"),
+            section("Classroom 103", 1080, 1200, "Evening course"),
+        ]
+
+    def testGBCUploadIsOneRequestOfEachKind(self) -> None:
+        day = self.GBCDay()
+        self.assertIsNone(self.ui.GBCScheduleToGSheets(self.date, day))
+        self.assertEqual(
+            self.stub.requests, ["get", "batchUpdate", "values.batchUpdate"]
+        )
+        for title, grid in ScheduleSheets.GBCGrids(self.date, day).items():
+            self.assertEqual(self.stub.grid("gbc", title), grid)
+            self.assertEqual(self.stub.size("gbc", title), (len(grid), 5))
+
+        # The spreadsheet stays open for the next upload
+        self.stub.requests.clear()
+        self.ui.GBCScheduleToGSheets(self.date, day)
+        self.assertEqual(self.stub.requests, ["batchUpdate", "values.batchUpdate"])
+
+    def testSFCUploadIsOneRequestOfEachKind(self) -> None:
+        day = [
+            section("Classroom 510", 540, 600, "Daytime course", "SFC"),
+            section("Classroom 605", 1080, 1200, "Evening course", "SFC"),
+        ]
+        self.assertIsNone(self.ui.SFCScheduleToGSheets(self.date, day))
+        self.assertEqual(
+            self.stub.requests, ["get", "batchUpdate", "values.batchUpdate"]
+        )
+        for title, grid in ScheduleSheets.SFCGrids(self.date, day).items():
+            self.assertEqual(self.stub.grid("sfc", title), self.written(grid))
+            self.assertEqual(self.stub.size("sfc", title), (len(day) + 6, 5))
+
+    def testSFCWorksheetFitsGridLongerThanTheDay(self) -> None:
+        # One block across all three floors lays out 11 rows for 3 sections
+        day = [
+            section(f"Classroom {room}", 540, 600, f"Course {room}", "SFC")
+            for room in (510, 605, 705)
+        ]
+        grid = ScheduleSheets.SFCGrids(self.date, day)["Daytime"]
+        self.assertEqual(len(grid), 11)
+        self.assertIsNone(self.ui.SFCScheduleToGSheets(self.date, day))
+        self.assertEqual(self.stub.size("sfc", "Daytime"), (11, 5))
+        self.assertEqual(self.stub.grid("sfc", "Daytime"), self.written(grid))
+
+    def sleeps(self) -> list[float]:
+        return [call.args[0] for call in self.sleep.call_args_list]
+
+    def uploadGBCAfterOpen(self, failures: list[tuple[int, dict]]) -> None:
+        # Open first, so the queued failures answer the upload's writes
+        ScheduleSheets.open(self.ui.GBCScheduleURL)
+        self.stub.requests.clear()
+        self.stub.failures = failures
+        self.ui.GBCScheduleToGSheets(self.date, self.GBCDay())
+
+    def snapshotExists(self) -> bool:
+        return os.path.exists(self.ui.sheetsSnapshotPath(self.ui.GBCScheduleURL))
+
+    def testQuotaErrorWaitsRetryAfter(self) -> None:
+        self.uploadGBCAfterOpen([(429, {"Retry-After": "7"})])
+        self.assertEqual(
+            self.stub.requests, ["batchUpdate", "batchUpdate", "values.batchUpdate"]
+        )
+        self.assertEqual(self.sleeps(), [7.0])
+        self.assertTrue(self.snapshotExists())
+
+    def testServerErrorsBackOffExponentially(self) -> None:
+        self.uploadGBCAfterOpen([(503, {}), (500, {})])
+        self.assertEqual(
+            self.stub.requests,
+            ["batchUpdate", "batchUpdate", "batchUpdate", "values.batchUpdate"],
+        )
+        first, second = self.sleeps()
+        self.assertLessEqual(first, ScheduleSheets.backoff)
+        self.assertLessEqual(second, ScheduleSheets.backoff * 2)
+        for title, grid in ScheduleSheets.GBCGrids(self.date, self.GBCDay()).items():
+            self.assertEqual(self.stub.grid("gbc", title), grid)
+
+    def testPermanentErrorIsNotRetried(self) -> None:
+        with self.assertRaises(HttpError) as raised:
+            self.uploadGBCAfterOpen([(400, {})])
+        self.assertEqual(raised.exception.resp.status, 400)
+        self.assertEqual(self.stub.requests, ["batchUpdate"])
+        self.assertEqual(self.sleeps(), [])
+        self.assertFalse(self.snapshotExists())
+
+    def testExhaustedAttemptsRaise(self) -> None:
+        with self.assertRaises(HttpError) as raised:
+            self.uploadGBCAfterOpen([(429, {})] * ScheduleSheets.attempts)
+        self.assertEqual(raised.exception.resp.status, 429)
+        self.assertEqual(self.stub.requests, ["batchUpdate"] * ScheduleSheets.attempts)
+        self.assertEqual(len(self.sleeps()), ScheduleSheets.attempts - 1)
+        self.assertFalse(self.snapshotExists())
+
+    def testFailedOpenSendsNoUpdate(self) -> None:
+        self.stub.failures = [(404, {})]
+        with self.assertRaises(HttpError):
+            self.ui.GBCScheduleToGSheets(self.date, self.GBCDay())
+        self.assertEqual(self.stub.requests, ["get"])
+
+    def testTransportErrorsAreRetried(self) -> None:
+        errors = [
+            ConnectionResetError(),
+            TimeoutError(),
+            ssl.SSLError(),
+            httplib2.ServerNotFoundError(),
+            TransportError(),
+        ]
+
+        def request() -> str:
+            if errors:
+                raise errors.pop(0)
+            return "sent"
+
+        self.assertEqual(ScheduleSheets.call(request, write=False), "sent")
+        self.assertEqual(len(self.sleeps()), 5)
+
+    def testWritesAreLimitedToTheQuotaRate(self) -> None:
+        # After the burst, each write waits for the bucket to refill a token
+        ScheduleSheets.tokens = 0
+        ScheduleSheets.refilled = AutoSigns.time.monotonic()
+        for _ in range(3):
+            ScheduleSheets.call(lambda: None)
+        self.assertEqual(len(self.sleeps()), 3)
+        for seconds in self.sleeps():
+            self.assertAlmostEqual(
+                seconds, 60 / ScheduleSheets.writesPerMinute, delta=0.1
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
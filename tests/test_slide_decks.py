@@ -0,0 +1,88 @@
+import tempfile
+import unittest
+
+import pandas as pd
+from pptx import Presentation
+from pptx.util import Pt
+
+from tests.helpers import AutoSigns, pptxTemplate, section
+
+SlideDecks = AutoSigns.SlideDecks
+TextFit = AutoSigns.TextFit
+
+
+class SlideDecksTest(unittest.TestCase):
+    columnWidths = (125.0, 125.0, 400.0, 130.0, 100.0)
+    # Slide height less the table's top and header row
+    height = 450.0
+
+    def fitPage(self, page: list[list[str]]) -> int | None:
+        return TextFit.fitTable(
+            tuple(map(tuple, page)),
+            "Calibri",
+            self.columnWidths,
+            self.height,
+            65,
+            SlideDecks.minimumFontSize,
+        )
+
+    def rows(self, count: int, title: str) -> list[list[str]]:
+        return [["9:00 AM", "10:00 AM", title, "TBA", "101"]] * count
+
+    def testFitTableReportsOverflow(self) -> None:
+        # Ten rows of titles that wrap to two lines need 648pt at 24pt
+        self.assertIsNone(self.fitPage(self.rows(10, "Long title " * 6)))
+        self.assertIsNotNone(self.fitPage(self.rows(10, "Short title")))
+
+    def testPaginateSplitsWrappedRows(self) -> None:
+        rows = self.rows(30, "Long title " * 6)
+        pages = SlideDecks.paginate(
+            rows, 20, lambda page: self.fitPage(page) is not None
+        )
+        self.assertEqual(sum(map(len, pages)), 30)
+        self.assertEqual([len(page) for page in pages], [6] * 5)
+        for page in pages:
+            self.assertIsNotNone(self.fitPage(page))
+
+    def testPaginateKeepsShortRowsTogether(self) -> None:
+        pages = SlideDecks.paginate(
+            self.rows(30, "Short"), 20, lambda page: self.fitPage(page) is not None
+        )
+        self.assertEqual([len(page) for page in pages], [10, 10, 10])
+
+    def testGBCDayFitsEverySlide(self) -> None:
+        day = [
+            section("Classroom 101", 540, 600, f"Section {index:02} " + "title " * 9)
+            for index in range(30)
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            template = pptxTemplate(directory, 21, list(map(int, self.columnWidths)))
+            path = SlideDecks.GBCDay(
+                template, f"{directory}/day.pptx", pd.Timestamp("2026-01-05"), day
+            )
+            prs = Presentation(path)
+
+        filled = 0
+        for slide in prs.slides:
+            if slide.shapes and slide.shapes[0].has_table:
+                rows = [
+                    tuple(cell.text for cell in row.cells)
+                    for row in list(slide.shapes[0].table.rows)[1:]
+                    if row.cells[0].text
+                ]
+                if not rows:
+                    continue
+                size = slide.shapes[0].table.cell(1, 0).text_frame.paragraphs[0]
+                size = size.runs[0].font.size / Pt(1)
+                self.assertGreaterEqual(size, SlideDecks.minimumFontSize)
+                height = sum(
+                    TextFit.rowHeight(row, "Calibri", self.columnWidths, int(size))
+                    for row in rows
+                )
+                self.assertLessEqual(height, self.height)
+                filled += len(rows)
+        self.assertEqual(filled, 30)
+
+
+if __name__ == "__main__":
+    unittest.main()